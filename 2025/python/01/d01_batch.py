@@ -0,0 +1,106 @@
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+
+import d01p01
+import d01p02
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from aoc.parsing import read_bytes
+from aoc.profiling import add_profile_arguments, run_with_profile
+
+PuzzleAnswer = int
+Filename = str
+
+DIAL_LENGTH = 100
+STARTING_POSITION = 50
+
+# Turns «L68» into «-68» and «R48» into «48»
+SIGN_TABLE = bytes.maketrans(b"L", b"-")
+
+
+def parse_rotations(data: bytes) -> np.ndarray:
+    return np.fromstring(data.translate(SIGN_TABLE, b"R"), dtype=np.int64, sep="\n")
+
+
+def read_rotations(input_filename: Filename) -> np.ndarray:
+    return parse_rotations(read_bytes(input_filename))
+
+
+def turn_batch(rotations: np.ndarray, length: int = DIAL_LENGTH,
+               starting_position: int = STARTING_POSITION) -> tuple[np.ndarray, np.ndarray]:
+    # Vectorized equivalent of calling «Dial.turn» for every rotation,
+    # returning the position after each turn and its zero crossings
+    end_positions = (starting_position + np.cumsum(rotations)) % length
+
+    start_positions = np.empty_like(end_positions)
+    start_positions[:1] = starting_position % length
+    start_positions[1:] = end_positions[:-1]
+
+    distances = np.abs(rotations)
+
+    # Turning right from «s» crosses zero once for every multiple of «length»
+    # in «(s, s + distance]». Turning left is the mirror image, measured from
+    # the distance to zero going left, which is «(length - s) % length».
+    right_crossings = (start_positions + distances) // length
+    left_crossings = ((length - start_positions) % length + distances) // length
+    zero_crossings = np.where(rotations > 0, right_crossings, left_crossings)
+
+    return end_positions, zero_crossings
+
+
+def solve(input_filename: Filename = "d01_input.txt", part: int = 2) -> PuzzleAnswer:
+    rotations = read_rotations(input_filename)
+    if len(rotations) == 0:
+        return 0
+
+    end_positions, zero_crossings = turn_batch(rotations)
+
+    if part == 1:
+        return int(np.count_nonzero(end_positions == 0))
+
+    return int(zero_crossings.sum())
+
+
+def run_tests() -> None:
+    test_filenames: list[Filename] = [
+        "d01_test01.txt",
+        "d01_test02.txt",
+        "d01_test03.txt",
+        "d01_input.txt",
+    ]
+
+    for input_filename in test_filenames:
+        for part, scalar_solve in [(1, d01p01.solve), (2, d01p02.solve)]:
+            expected_answer = scalar_solve(input_filename)
+            solution_answer = solve(input_filename, part)
+            assert solution_answer == expected_answer, (
+                f"Test for intput {input_filename} (part {part}) failed.\n"
+                f"Expected: {expected_answer}.\n"
+                f"Got:      {solution_answer}."
+            )
+
+
+def main() -> None:
+    print("Running tests...")
+    run_tests()
+    print("Tests ran successfuly!\n")
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("filename", nargs="?", help="puzzle input file")
+    parser.add_argument("--part", type=int, choices=[1, 2], default=2)
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+
+    if args.filename:
+        print(f"Solving the puzzle with input {args.filename}...")
+        answer = run_with_profile(args.profile, solve, args.filename, args.part,
+                                  report_path=args.profile_output)
+        print(f"Answer: {answer}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+import argparse
+import mmap
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+import d01p01
+import d01p02
+from d01_batch import DIAL_LENGTH, STARTING_POSITION, parse_rotations
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from aoc.profiling import add_profile_arguments, run_with_profile
+
+PuzzleAnswer = int
+Filename = str
+
+ByteRange = tuple[int, int]
+
+
+class DialSegment(NamedTuple):
+    # Each array is indexed by the dial position the segment starts at
+    end_positions: np.ndarray
+    zero_hits: np.ndarray
+    zero_crossings: np.ndarray
+
+    @classmethod
+    def identity(cls, length: int = DIAL_LENGTH) -> "DialSegment":
+        return cls(np.arange(length, dtype=np.int64),
+                   np.zeros(length, dtype=np.int64),
+                   np.zeros(length, dtype=np.int64))
+
+    def then(self, segment: "DialSegment") -> "DialSegment":
+        # Follow this segment with «segment», which starts wherever this
+        # one ended
+        return DialSegment(segment.end_positions[self.end_positions],
+                           self.zero_hits + segment.zero_hits[self.end_positions],
+                           self.zero_crossings + segment.zero_crossings[self.end_positions])
+
+
+def summarise_rotations(rotations: np.ndarray, length: int = DIAL_LENGTH) -> DialSegment:
+    starts = np.arange(length, dtype=np.int64)
+    if len(rotations) == 0:
+        return DialSegment.identity(length)
+
+    # Offsets of the unwrapped dial from its start position, before and
+    # after every turn
+    after = np.cumsum(rotations)
+    before = np.concatenate(([0], after[:-1]))
+
+    # A turn from «a» to «b» crosses zero once for every multiple of «length»
+    # in «(a, b]» when turning right and in «[b, a)» when turning left, i.e.
+    # «floor(b / length) - floor(a / length)» and
+    # «floor((a - 1) / length) - floor((b - 1) / length)» respectively.
+    # Starting at «s», «floor((s + x) / length)» is «floor(x / length)» plus
+    # one for every «s >= length - x % length», so the crossings of all start
+    # positions follow from a histogram of those thresholds.
+    right = rotations > 0
+    terms = np.concatenate((np.where(right, after, before - 1),
+                            np.where(right, before, after - 1)))
+    signs = np.concatenate((np.ones(len(rotations), dtype=np.int64),
+                            -np.ones(len(rotations), dtype=np.int64)))
+
+    base_crossings = int(np.sum(signs * (terms // length)))
+    thresholds = length - terms % length
+    threshold_counts = np.bincount(thresholds, weights=signs, minlength=length + 1)
+    zero_crossings = base_crossings + np.cumsum(threshold_counts[:length]).astype(np.int64)
+
+    # The dial stops at zero after a turn when it started at «-offset»
+    zero_hits = np.bincount((-after) % length, minlength=length).astype(np.int64)
+
+    end_positions = (starts + after[-1]) % length
+
+    return DialSegment(end_positions, zero_hits, zero_crossings)
+
+
+def get_chunk_ranges(input_filename: Filename, chunk_count: int) -> list[ByteRange]:
+    with open(input_filename, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return []
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Move every boundary past the end of the line it falls into
+            boundaries = [0]
+            for chunk_i in range(1, chunk_count):
+                boundary = mm.find(b"\n", max(boundaries[-1], size * chunk_i // chunk_count))
+                if boundary == -1:
+                    break
+                boundaries.append(boundary + 1)
+            boundaries.append(size)
+
+    return [(start, end) for start, end in zip(boundaries, boundaries[1:]) if start < end]
+
+
+def summarise_chunk(input_filename: Filename, byte_range: ByteRange) -> DialSegment:
+    start, end = byte_range
+
+    with open(input_filename, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            rotations = parse_rotations(mm[start:end])
+
+    return summarise_rotations(rotations)
+
+
+def solve(input_filename: Filename = "d01_input.txt", part: int = 2,
+          workers: int | None = None, chunk_count: int | None = None) -> PuzzleAnswer:
+    if chunk_count is None:
+        chunk_count = 4 * (workers or os.cpu_count() or 1)
+
+    chunk_ranges = get_chunk_ranges(input_filename, chunk_count)
+
+    segment = DialSegment.identity()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunk_segments = executor.map(summarise_chunk,
+                                      [input_filename] * len(chunk_ranges),
+                                      chunk_ranges)
+        for chunk_segment in chunk_segments:
+            segment = segment.then(chunk_segment)
+
+    if part == 1:
+        return int(segment.zero_hits[STARTING_POSITION])
+
+    return int(segment.zero_crossings[STARTING_POSITION])
+
+
+def run_tests() -> None:
+    test_filenames: list[Filename] = [
+        "d01_test01.txt",
+        "d01_test02.txt",
+        "d01_test03.txt",
+        "d01_input.txt",
+    ]
+
+    for input_filename in test_filenames:
+        for part, scalar_solve in [(1, d01p01.solve), (2, d01p02.solve)]:
+            expected_answer = scalar_solve(input_filename)
+            solution_answer = solve(input_filename, part, chunk_count=7)
+            assert solution_answer == expected_answer, (
+                f"Test for intput {input_filename} (part {part}) failed.\n"
+                f"Expected: {expected_answer}.\n"
+                f"Got:      {solution_answer}."
+            )
+
+
+def main() -> None:
+    print("Running tests...")
+    run_tests()
+    print("Tests ran successfuly!\n")
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("filename", nargs="?", help="puzzle input file")
+    parser.add_argument("--part", type=int, choices=[1, 2], default=2)
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker process count (CPU count by default)")
+    parser.add_argument("--chunks", type=int, default=None,
+                        help="number of byte ranges the file is split into")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+
+    if args.filename:
+        print(f"Solving the puzzle with input {args.filename}...")
+        answer = run_with_profile(args.profile, solve, args.filename, args.part,
+                                  args.workers, args.chunks,
+                                  report_path=args.profile_output)
+        print(f"Answer: {answer}")
+
+
+if __name__ == "__main__":
+    main()
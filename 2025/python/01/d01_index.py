@@ -0,0 +1,160 @@
+import argparse
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+
+from d01_batch import DIAL_LENGTH, STARTING_POSITION, read_rotations, turn_batch
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from aoc.cache import CACHE_DIR, file_digest, is_cache_enabled
+
+Filename = str
+
+INDEX_VERSION = 1
+
+INDEX_ARRAYS = ["positions", "hit_counts", "crossing_counts"]
+
+
+class RotationIndex:
+    # Rotations are numbered from 1. Index «k» of every array describes the
+    # dial after the first «k» rotations, so index 0 is the starting state.
+    def __init__(self, positions: np.ndarray, hit_counts: np.ndarray,
+                 crossing_counts: np.ndarray) -> None:
+        self.positions = positions
+        self.hit_counts = hit_counts
+        self.crossing_counts = crossing_counts
+
+    @classmethod
+    def build(cls, rotations: np.ndarray, length: int = DIAL_LENGTH,
+              starting_position: int = STARTING_POSITION) -> "RotationIndex":
+        end_positions, zero_crossings = turn_batch(rotations, length, starting_position)
+
+        positions = np.empty(len(rotations) + 1, dtype=np.min_scalar_type(length - 1))
+        positions[0] = starting_position % length
+        positions[1:] = end_positions
+
+        hit_counts = np.zeros(len(rotations) + 1, dtype=np.int64)
+        np.cumsum(end_positions == 0, out=hit_counts[1:])
+
+        crossing_counts = np.zeros(len(rotations) + 1, dtype=np.int64)
+        np.cumsum(zero_crossings, out=crossing_counts[1:])
+
+        return cls(positions, hit_counts, crossing_counts)
+
+    @classmethod
+    def load_or_build(cls, input_filename: Filename) -> "RotationIndex":
+        if not is_cache_enabled():
+            return cls.build(read_rotations(input_filename))
+
+        index_dir = CACHE_DIR / f"d01-index-v{INDEX_VERSION}-{file_digest(input_filename)}"
+        if all((index_dir / f"{name}.npy").is_file() for name in INDEX_ARRAYS):
+            return cls(*(np.load(index_dir / f"{name}.npy", mmap_mode="r")
+                         for name in INDEX_ARRAYS))
+
+        index = cls.build(read_rotations(input_filename))
+        index.save(index_dir)
+
+        return index
+
+    def save(self, index_dir: Path) -> None:
+        index_dir.mkdir(parents=True, exist_ok=True)
+
+        for name in INDEX_ARRAYS:
+            tmp_path = index_dir / f"{name}.{os.getpid()}.tmp.npy"
+            np.save(tmp_path, getattr(self, name))
+            os.replace(tmp_path, index_dir / f"{name}.npy")
+
+    def get_rotation_count(self) -> int:
+        return len(self.positions) - 1
+
+    def position_after(self, k: int) -> int:
+        return int(self.positions[k])
+
+    def hits_between(self, i: int, j: int) -> int:
+        # Zero hits of rotations «i + 1» through «j»
+        return int(self.hit_counts[j] - self.hit_counts[i])
+
+    def crossings_between(self, i: int, j: int) -> int:
+        # Zero crossings of rotations «i + 1» through «j»
+        return int(self.crossing_counts[j] - self.crossing_counts[i])
+
+    def nth_hit(self, n: int) -> int | None:
+        # The rotation which stops at zero for the «n»-th time
+        if n < 1 or n > self.hit_counts[-1]:
+            return None
+
+        return int(np.searchsorted(self.hit_counts, n, side="left"))
+
+
+def run_tests() -> None:
+    test_filenames: list[Filename] = [
+        "d01_test01.txt",
+        "d01_test03.txt",
+        "d01_input.txt",
+    ]
+
+    for input_filename in test_filenames:
+        rotations = read_rotations(input_filename)
+        index = RotationIndex.load_or_build(input_filename)
+        end_positions, zero_crossings = turn_batch(rotations)
+
+        rotation_count = len(rotations)
+        for i, j in [(0, rotation_count), (0, 1), (rotation_count // 3, rotation_count // 2)]:
+            expected_hits = int(np.count_nonzero(end_positions[i:j] == 0))
+            expected_crossings = int(zero_crossings[i:j].sum())
+            assert index.hits_between(i, j) == expected_hits, (
+                f"Hit query ({i}, {j}) for intput {input_filename} failed.\n"
+                f"Expected: {expected_hits}.\n"
+                f"Got:      {index.hits_between(i, j)}."
+            )
+            assert index.crossings_between(i, j) == expected_crossings, (
+                f"Crossing query ({i}, {j}) for intput {input_filename} failed.\n"
+                f"Expected: {expected_crossings}.\n"
+                f"Got:      {index.crossings_between(i, j)}."
+            )
+
+        assert index.position_after(rotation_count) == end_positions[-1]
+
+        first_hit = index.nth_hit(1)
+        if first_hit is not None:
+            assert end_positions[first_hit - 1] == 0
+            assert not np.any(end_positions[:first_hit - 1] == 0)
+
+
+def main() -> None:
+    print("Running tests...")
+    run_tests()
+    print("Tests ran successfuly!\n")
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("filename", nargs="?", help="rotation log file")
+    parser.add_argument("--position", type=int, metavar="K",
+                        help="dial position after the first K rotations")
+    parser.add_argument("--hits", type=int, nargs=2, metavar=("I", "J"),
+                        help="zero hits of rotations I + 1 through J")
+    parser.add_argument("--crossings", type=int, nargs=2, metavar=("I", "J"),
+                        help="zero crossings of rotations I + 1 through J")
+    parser.add_argument("--nth-hit", type=int, metavar="N",
+                        help="rotation which stops at zero for the N-th time")
+    args = parser.parse_args()
+
+    if args.filename:
+        index = RotationIndex.load_or_build(args.filename)
+        print(f"Indexed {index.get_rotation_count()} rotations of {args.filename}.")
+
+        if args.position is not None:
+            print(f"Position after {args.position}: {index.position_after(args.position)}")
+        if args.hits is not None:
+            print(f"Zero hits in ({args.hits[0]}, {args.hits[1]}]: {index.hits_between(*args.hits)}")
+        if args.crossings is not None:
+            print(f"Zero crossings in ({args.crossings[0]}, {args.crossings[1]}]: "
+                  f"{index.crossings_between(*args.crossings)}")
+        if args.nth_hit is not None:
+            print(f"Zero hit #{args.nth_hit}: {index.nth_hit(args.nth_hit)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,10 @@
 import argparse
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from aoc.profiling import add_profile_arguments, run_with_profile
 
 Direction = str
 LEFT = "L"
@@ -34,9 +40,11 @@ def solve(input_filename: str = "d01_input.txt") -> int:
 def main() -> None:
     parser = argparse.ArgumentParser()
     parser.add_argument("filename", nargs="?", help="puzzle input file")
+    add_profile_arguments(parser)
     args = parser.parse_args()
 
-    answer = solve(args.filename)
+    answer = run_with_profile(args.profile, solve, args.filename,
+                              report_path=args.profile_output)
 
     print(answer)
 
@@ -0,0 +1,215 @@
+import argparse
+import bisect
+import mmap
+import os
+import sys
+from array import array
+from pathlib import Path
+from typing import Sequence
+
+import d02p01
+import d02p02
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from aoc.cache import CACHE_DIR, is_cache_enabled
+from aoc.profiling import add_profile_arguments, run_with_profile
+
+PuzzleAnswer = int
+Filename = str
+
+IdRange = tuple[int, int]
+
+TABLE_VERSION = 1
+
+# Part 1 IDs are a block repeated exactly twice, part 2 IDs at least twice
+RULES = ["double", "repeated"]
+
+DEFAULT_DIGIT_LIMIT = 10
+
+INT64_MAX = 2 ** 63 - 1
+
+# Sum of the invalid IDs of a rule in an inclusive range, without a table
+CLOSED_FORMS = {
+    "double": d02p01.doubled_id_sum_in_range,
+    "repeated": d02p02.repeated_id_sum_in_range,
+}
+
+
+def get_block_lengths(rule: str, length: int) -> list[int]:
+    if rule == "double":
+        return [length // 2] if length % 2 == 0 else []
+
+    return [k for k in range(1, length // 2 + 1) if length % k == 0]
+
+
+def get_max_digit_limit(rule: str) -> int:
+    # Longest IDs a table can cover before its prefix sums overflow int64
+    digit_limit = 1
+    while CLOSED_FORMS[rule](1, 10 ** (digit_limit + 1) - 1) <= INT64_MAX:
+        digit_limit += 1
+
+    return digit_limit
+
+
+def build_table(rule: str, digit_limit: int) -> tuple[array, array]:
+    max_digit_limit = get_max_digit_limit(rule)
+    if digit_limit > max_digit_limit:
+        raise ValueError(f"Prefix sums of the {rule} IDs with up to {digit_limit} digits "
+                         f"do not fit into int64, the limit is {max_digit_limit} digits")
+
+    ids = array("q")
+    prefix_sums = array("q", [0])
+
+    id_sum = 0
+    for length in range(2, digit_limit + 1):
+        length_ids: set[int] = set()
+        for block_length in get_block_lengths(rule, length):
+            # Every «block_length»-digit block times the repunit of its
+            # period, which is a plain range with the repunit as its step
+            repunit = (10 ** length - 1) // (10 ** block_length - 1)
+            length_ids.update(range(10 ** (block_length - 1) * repunit,
+                                    10 ** block_length * repunit, repunit))
+
+        for invalid_id in sorted(length_ids):
+            id_sum += invalid_id
+            ids.append(invalid_id)
+            prefix_sums.append(id_sum)
+
+    return ids, prefix_sums
+
+
+class InvalidIdTable:
+    # «prefix_sums[i]» is the sum of the first «i» IDs, so it is one longer
+    # than «ids». Both are either arrays or views into a memory-mapped file.
+    def __init__(self, ids: Sequence[int], prefix_sums: Sequence[int],
+                 mm: mmap.mmap | None = None) -> None:
+        self.ids = ids
+        self.prefix_sums = prefix_sums
+        self.mm = mm
+
+    @classmethod
+    def load_or_build(cls, rule: str, digit_limit: int = DEFAULT_DIGIT_LIMIT) -> "InvalidIdTable":
+        if not is_cache_enabled():
+            return cls(*build_table(rule, digit_limit))
+
+        table_path = CACHE_DIR / f"d02-table-v{TABLE_VERSION}-{rule}-{digit_limit}.bin"
+        if not table_path.is_file():
+            cls.save(table_path, *build_table(rule, digit_limit))
+
+        return cls.load(table_path)
+
+    @staticmethod
+    def save(table_path: Path, ids: array, prefix_sums: array) -> None:
+        table_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # The ID count, the IDs and the prefix sums as consecutive int64s
+        tmp_path = table_path.with_name(f"{table_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            array("q", [len(ids)]).tofile(f)
+            ids.tofile(f)
+            prefix_sums.tofile(f)
+        os.replace(tmp_path, table_path)
+
+    @classmethod
+    def load(cls, table_path: Path) -> "InvalidIdTable":
+        with open(table_path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        values = memoryview(mm).cast("q")
+        id_count = values[0]
+
+        return cls(values[1:id_count + 1], values[id_count + 1:], mm)
+
+    def get_id_count(self) -> int:
+        return len(self.ids)
+
+    def id_sum_in_range(self, start_id: int, end_id: int) -> int:
+        if start_id > end_id:
+            return 0
+
+        low = bisect.bisect_left(self.ids, start_id)
+        high = bisect.bisect_right(self.ids, end_id)
+
+        return self.prefix_sums[high] - self.prefix_sums[low]
+
+
+def read_ranges(input_filename: Filename) -> list[IdRange]:
+    with open(input_filename, "r", encoding="utf-8") as file:
+        id_ranges = file.read().split(',')
+
+    ranges: list[IdRange] = []
+    for id_range in id_ranges:
+        boundary_id_strs = id_range.split('-')
+        ranges.append((int(boundary_id_strs[0]), int(boundary_id_strs[1])))
+
+    return ranges
+
+
+def solve(input_filename: Filename = "d02_input.txt", rule: str = "repeated",
+          digit_limit: int | None = None) -> PuzzleAnswer:
+    ranges = read_ranges(input_filename)
+
+    # Tables cover every ID with up to «digit_limit» digits, so the largest
+    # end ID decides the smallest table which answers all of the ranges.
+    # Tables only go as far as their prefix sums fit into int64, and any
+    # longer IDs are left to the closed form.
+    if digit_limit is None:
+        needed_digit_limit = max((len(str(end_id)) for _, end_id in ranges), default=1)
+        digit_limit = min(max(DEFAULT_DIGIT_LIMIT, needed_digit_limit),
+                          get_max_digit_limit(rule))
+
+    table = InvalidIdTable.load_or_build(rule, digit_limit)
+    table_end_id = 10 ** digit_limit - 1
+
+    invalid_id_sum = 0
+    for start_id, end_id in ranges:
+        invalid_id_sum += table.id_sum_in_range(start_id, min(end_id, table_end_id))
+        if end_id > table_end_id:
+            invalid_id_sum += CLOSED_FORMS[rule](max(start_id, table_end_id + 1), end_id)
+
+    return invalid_id_sum
+
+
+def run_tests() -> None:
+    test_filenames: list[Filename] = [
+        "d02_test_01.txt",
+        "d02_test_02.txt",
+        "d02_input.txt",
+    ]
+
+    for input_filename in test_filenames:
+        for rule, scalar_solve in [("double", d02p01.solve), ("repeated", d02p02.solve)]:
+            expected_answer = scalar_solve(input_filename)
+            solution_answer = solve(input_filename, rule)
+            assert solution_answer == expected_answer, (
+                f"Test for intput {input_filename} ({rule} rule) failed.\n"
+                f"Expected: {expected_answer}.\n"
+                f"Got:      {solution_answer}."
+            )
+
+
+def main() -> None:
+    print("Running tests...")
+    run_tests()
+    print("Tests ran successfuly!\n")
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("filename", nargs="?", help="puzzle input file")
+    parser.add_argument("--rule", choices=RULES, default="repeated",
+                        help="double for part 1, repeated for part 2")
+    parser.add_argument("--digit-limit", type=int, default=None,
+                        help="longest ID the table covers, longer ones use the closed "
+                             "form (input's longest that fits into int64 by default)")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+
+    if args.filename:
+        print(f"Solving the puzzle with input {args.filename}...")
+        answer = run_with_profile(args.profile, solve, args.filename, args.rule,
+                                  args.digit_limit, report_path=args.profile_output)
+        print(f"Answer: {answer}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+import argparse
+import itertools
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Iterator
+
+import d02p01
+import d02p02
+from d02_table import IdRange, read_ranges
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from aoc.profiling import add_profile_arguments, run_with_profile
+
+PuzzleAnswer = int
+Filename = str
+
+# Sums of the part 1 (double) and part 2 (repeated) invalid IDs
+IdSums = tuple[int, int]
+
+DEFAULT_SHARD_SIZE = 100_000
+
+PROGRESS_INTERVAL = 1.0
+
+# Shards submitted to the pool but not finished yet, per worker
+SHARDS_IN_FLIGHT_PER_WORKER = 4
+
+
+def get_shards(ranges: list[IdRange], shard_size: int) -> Iterator[IdRange]:
+    # Generated lazily, as a wide range can be split into millions of shards
+    for start_id, end_id in ranges:
+        for shard_start in range(start_id, end_id + 1, shard_size):
+            yield (shard_start, min(shard_start + shard_size - 1, end_id))
+
+
+def shard_id_sums(shard: IdRange) -> IdSums:
+    start_id, end_id = shard
+
+    # Every double ID is a repeated one, so the cheaper test only runs on
+    # the few IDs which pass the other one
+    is_double = d02p01.is_double
+    is_multiple_chained = d02p02.is_multiple_chained
+
+    double_sum = 0
+    repeated_sum = 0
+    for current_id in range(start_id, end_id + 1):
+        id_str = str(current_id)
+        if is_multiple_chained(id_str):
+            repeated_sum += current_id
+            if is_double(id_str):
+                double_sum += current_id
+
+    return double_sum, repeated_sum
+
+
+def brute_force(ranges: list[IdRange], workers: int | None = None,
+                shard_size: int = DEFAULT_SHARD_SIZE, progress: bool = False) -> IdSums:
+    shards = get_shards(ranges, shard_size)
+    id_count = sum(max(end_id - start_id + 1, 0) for start_id, end_id in ranges)
+    max_in_flight = SHARDS_IN_FLIGHT_PER_WORKER * (workers or os.cpu_count() or 1)
+
+    double_sum = 0
+    repeated_sum = 0
+    checked_count = 0
+
+    start_time = time.perf_counter()
+    last_report = start_time
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Only a bounded number of shards is ever submitted, the next ones
+        # are taken from the generator as the earlier ones finish
+        in_flight: dict[Future[IdSums], IdRange] = {}
+        for shard in itertools.islice(shards, max_in_flight):
+            in_flight[executor.submit(shard_id_sums, shard)] = shard
+
+        while len(in_flight) > 0:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                shard_double_sum, shard_repeated_sum = future.result()
+                double_sum += shard_double_sum
+                repeated_sum += shard_repeated_sum
+
+                start_id, end_id = in_flight.pop(future)
+                checked_count += end_id - start_id + 1
+
+            for shard in itertools.islice(shards, len(done)):
+                in_flight[executor.submit(shard_id_sums, shard)] = shard
+
+            now = time.perf_counter()
+            if progress and (now - last_report >= PROGRESS_INTERVAL or checked_count == id_count):
+                last_report = now
+                print(f"Checked {checked_count}/{id_count} IDs "
+                      f"({100 * checked_count / max(id_count, 1):.1f}%), "
+                      f"{checked_count / max(now - start_time, 1e-9):,.0f} IDs/s",
+                      file=sys.stderr)
+
+    return double_sum, repeated_sum
+
+
+def closed_form(ranges: list[IdRange]) -> IdSums:
+    double_sum = sum(d02p01.doubled_id_sum_in_range(start_id, end_id)
+                     for start_id, end_id in ranges)
+    repeated_sum = sum(d02p02.repeated_id_sum_in_range(start_id, end_id)
+                       for start_id, end_id in ranges)
+
+    return double_sum, repeated_sum
+
+
+def verify(input_filename: Filename = "d02_input.txt", workers: int | None = None,
+           shard_size: int = DEFAULT_SHARD_SIZE, progress: bool = True) -> bool:
+    ranges = read_ranges(input_filename)
+
+    expected_sums = brute_force(ranges, workers, shard_size, progress)
+    solution_sums = closed_form(ranges)
+
+    for rule, expected_sum, solution_sum in zip(["double", "repeated"],
+                                                expected_sums, solution_sums):
+        status = "OK" if expected_sum == solution_sum else "MISMATCH"
+        print(f"{rule:>8}: brute force {expected_sum}, closed form {solution_sum} [{status}]")
+
+    return expected_sums == solution_sums
+
+
+def run_tests() -> None:
+    test_filenames: list[Filename] = [
+        "d02_test_01.txt",
+    ]
+
+    for input_filename in test_filenames:
+        ranges = read_ranges(input_filename)
+
+        expected_sums = (d02p01.solve(input_filename), d02p02.solve(input_filename))
+        solution_sums = brute_force(ranges, workers=2, shard_size=7)
+        assert solution_sums == expected_sums, (
+            f"Test for intput {input_filename} failed.\n"
+            f"Expected: {expected_sums}.\n"
+            f"Got:      {solution_sums}."
+        )
+
+
+def main() -> None:
+    print("Running tests...")
+    run_tests()
+    print("Tests ran successfuly!\n")
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("filename", nargs="?", help="puzzle input file")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker process count (CPU count by default)")
+    parser.add_argument("--shard-size", type=int, default=DEFAULT_SHARD_SIZE,
+                        help="IDs checked by a single task")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+
+    if args.filename:
+        print(f"Verifying the closed forms with input {args.filename} "
+              f"on {args.workers or os.cpu_count()} workers...")
+        matches = run_with_profile(args.profile, verify, args.filename, args.workers,
+                                   args.shard_size, report_path=args.profile_output)
+        if not matches:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,12 @@
 import argparse
 import re
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from aoc.verify import is_verified, record_verified
+from aoc.profiling import add_profile_arguments, run_with_profile
 
 PuzzleAnswer = int
 Filename = str
@@ -39,6 +46,29 @@ def is_double(id_str: str) -> bool:
     return id_str[:boundary] == id_str[boundary:]
 
 
+# Arithmetic version, independent of the width of the range
+def doubled_id_sum_in_range(start_id: int, end_id: int) -> int:
+    invalid_id_sum = 0
+
+    # IDs made of a k-digit half «h» repeated twice are exactly
+    # «h * (10^k + 1)», so every half length contributes the sum of
+    # an arithmetic series over the halves which land inside the range
+    half_length = 1
+    while 10 ** (half_length - 1) * (10 ** half_length + 1) <= end_id:
+        multiplier = 10 ** half_length + 1
+
+        low_half = max(10 ** (half_length - 1), -(-start_id // multiplier))
+        high_half = min(10 ** half_length - 1, end_id // multiplier)
+
+        if low_half <= high_half:
+            half_count = high_half - low_half + 1
+            invalid_id_sum += multiplier * (low_half + high_half) * half_count // 2
+
+        half_length += 1
+
+    return invalid_id_sum
+
+
 def solve(input_filename: str = "d02_input.txt") -> PuzzleAnswer:
     invalid_id_sum = 0
 
@@ -52,7 +82,8 @@ def solve(input_filename: str = "d02_input.txt") -> PuzzleAnswer:
         end_id = int(boundary_id_strs[1])
 
         # invalid_id_sum += invalid_id_sum_in_range(start_id, end_id)
-        invalid_id_sum += iisir_alt(start_id, end_id)
+        # invalid_id_sum += iisir_alt(start_id, end_id)
+        invalid_id_sum += doubled_id_sum_in_range(start_id, end_id)
 
 
     return invalid_id_sum
@@ -65,12 +96,16 @@ def run_tests() -> None:
     ]
 
     for input_filename, expected_answer in test_pairs:
+        if is_verified(__file__, input_filename, expected_answer):
+            continue
+
         solution_answer = solve(input_filename)
         assert solution_answer == expected_answer, (
             f"Test for intput {input_filename} failed.\n"
             f"Expected: {expected_answer}.\n"
             f"Got: {solution_answer}."
         )
+        record_verified(__file__, input_filename, expected_answer)
 
 
 def main() -> None:
@@ -80,9 +115,11 @@ def main() -> None:
 
     parser = argparse.ArgumentParser()
     parser.add_argument("filename", nargs="?", help="puzzle input file")
+    add_profile_arguments(parser)
     args = parser.parse_args()
 
-    answer = solve(args.filename)
+    answer = run_with_profile(args.profile, solve, args.filename,
+                              report_path=args.profile_output)
 
     print(answer)
 
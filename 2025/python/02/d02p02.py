@@ -1,5 +1,14 @@
 import argparse
+import itertools
+import math
 import re
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from aoc.verify import is_verified, record_verified
+from aoc.profiling import add_profile_arguments, run_with_profile
 
 PuzzleAnswer = int
 Filename = str
@@ -56,6 +65,61 @@ def is_k_chained(string: str, k: int) -> bool:
     return True
 
 
+# Arithmetic version, independent of the width of the range
+def repeated_id_sum_in_range(start_id: int, end_id: int) -> int:
+    invalid_id_sum = 0
+
+    for length in range(2, len(str(end_id)) + 1):
+        # Every ID of «length» digits made of a repeated block has a period
+        # «length / p» for some prime «p» dividing «length». An ID with
+        # periods «length / p» and «length / q» has the period «length / pq»
+        # too, so inclusion-exclusion over the products of distinct primes
+        # (i.e. the Möbius function) counts every such ID exactly once.
+        primes = get_prime_factors(length)
+        for prime_count in range(1, len(primes) + 1):
+            sign = 1 if prime_count % 2 == 1 else -1
+            for prime_subset in itertools.combinations(primes, prime_count):
+                block_length = length // math.prod(prime_subset)
+                invalid_id_sum += sign * periodic_id_sum_in_range(start_id, end_id,
+                                                                  length, block_length)
+
+    return invalid_id_sum
+
+
+def periodic_id_sum_in_range(start_id: int, end_id: int,
+                             length: int, block_length: int) -> int:
+    # IDs of «length» digits repeating a «block_length»-digit block «b» are
+    # exactly «b * repunit», with «repunit» being «1» followed by «0»s at
+    # every «block_length»-th digit, so they form an arithmetic series
+    repunit = (10 ** length - 1) // (10 ** block_length - 1)
+
+    low_block = max(10 ** (block_length - 1), -(-start_id // repunit))
+    high_block = min(10 ** block_length - 1, end_id // repunit)
+
+    if low_block > high_block:
+        return 0
+
+    block_count = high_block - low_block + 1
+    return repunit * (low_block + high_block) * block_count // 2
+
+
+def get_prime_factors(n: int) -> list[int]:
+    primes: list[int] = []
+
+    factor = 2
+    while factor * factor <= n:
+        if n % factor == 0:
+            primes.append(factor)
+            while n % factor == 0:
+                n //= factor
+        factor += 1
+
+    if n > 1:
+        primes.append(n)
+
+    return primes
+
+
 def solve(input_filename: str = "d02_input.txt") -> PuzzleAnswer:
     invalid_id_sum = 0
 
@@ -69,7 +133,8 @@ def solve(input_filename: str = "d02_input.txt") -> PuzzleAnswer:
         end_id = int(boundary_id_strs[1])
 
         # invalid_id_sum += invalid_id_sum_in_range(start_id, end_id)
-        invalid_id_sum += iisir_alt(start_id, end_id)
+        # invalid_id_sum += iisir_alt(start_id, end_id)
+        invalid_id_sum += repeated_id_sum_in_range(start_id, end_id)
 
 
     return invalid_id_sum
@@ -82,12 +147,16 @@ def run_tests() -> None:
     ]
 
     for input_filename, expected_answer in test_pairs:
+        if is_verified(__file__, input_filename, expected_answer):
+            continue
+
         solution_answer = solve(input_filename)
         assert solution_answer == expected_answer, (
             f"Test for intput {input_filename} failed.\n"
             f"Expected: {expected_answer}.\n"
             f"Got:      {solution_answer}."
         )
+        record_verified(__file__, input_filename, expected_answer)
 
 
 def main() -> None:
@@ -97,9 +166,11 @@ def main() -> None:
 
     parser = argparse.ArgumentParser()
     parser.add_argument("filename", nargs="?", help="puzzle input file")
+    add_profile_arguments(parser)
     args = parser.parse_args()
 
-    answer = solve(args.filename)
+    answer = run_with_profile(args.profile, solve, args.filename,
+                              report_path=args.profile_output)
 
     print(answer)
 
@@ -0,0 +1,125 @@
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+
+import d03p01
+import d03p02
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from aoc.parsing import DIGIT_TABLE, read_bytes
+from aoc.profiling import add_profile_arguments, run_with_profile
+
+PuzzleAnswer = int
+Filename = str
+
+# Joltages are accumulated in int64, which holds any 18-digit number
+MAX_BATTERY_COUNT = 18
+
+
+def parse_banks(data: bytes) -> np.ndarray:
+    # One row per bank, one digit value per column
+    data = data.replace(b"\r\n", b"\n").translate(DIGIT_TABLE).rstrip(b"\n")
+    if len(data) == 0:
+        return np.zeros((0, 0), dtype=np.uint8)
+
+    width = data.find(b"\n")
+    if width == -1:
+        width = len(data)
+
+    # Every line but the last one is followed by a line break, which is
+    # dropped as an extra column once the rows are laid out side by side
+    bank_count = (len(data) + 1) // (width + 1)
+    if bank_count * (width + 1) != len(data) + 1:
+        raise ValueError("Banks must all have the same number of batteries")
+
+    banks = np.frombuffer(data + b"\n", dtype=np.uint8).reshape(bank_count, width + 1)
+    if np.any(banks[:, width] != ord("\n")):
+        raise ValueError("Banks must all have the same number of batteries")
+
+    return banks[:, :width]
+
+
+def read_banks(input_filename: Filename) -> np.ndarray:
+    return parse_banks(read_bytes(input_filename))
+
+
+def maximum_joltages(banks: np.ndarray, battery_count: int = 12) -> np.ndarray:
+    bank_count, bank_length = banks.shape
+    to_pick = min(bank_length, battery_count)
+    if to_pick > MAX_BATTERY_COUNT:
+        raise ValueError(f"Joltages of more than {MAX_BATTERY_COUNT} batteries overflow int64")
+
+    rows = np.arange(bank_count)
+    column_type = np.min_scalar_type(bank_length)
+    columns = np.arange(bank_length, dtype=column_type)
+
+    joltages = np.zeros(bank_count, dtype=np.int64)
+    starts = np.zeros(bank_count, dtype=column_type)
+
+    # Same greedy choice as the monotonic stack: the «r»-th battery is the
+    # leftmost largest digit after the previous pick which still leaves
+    # enough batteries for the rest, i.e. at most at «bank_length - to_pick + r».
+    # Setting bit 4 on the digits inside each row's window makes every one
+    # of them larger than any digit outside, so a plain argmax finds it.
+    for r in range(to_pick):
+        window_end = bank_length - to_pick + r + 1
+        window_start = int(starts.min())
+
+        in_window = columns[window_start:window_end] >= starts[:, None]
+        window = banks[:, window_start:window_end] | (in_window.view(np.uint8) << 4)
+
+        picks = window_start + np.argmax(window, axis=1)
+        joltages = joltages * 10 + banks[rows, picks]
+        starts = (picks + 1).astype(column_type)
+
+    return joltages
+
+
+def solve(input_filename: Filename = "d03_input.txt", battery_count: int = 12) -> PuzzleAnswer:
+    banks = read_banks(input_filename)
+
+    return int(maximum_joltages(banks, battery_count).sum())
+
+
+def run_tests() -> None:
+    test_filenames: list[Filename] = [
+        "d03_test_01.txt",
+        "d03_test_02.txt",
+        "d03_input.txt",
+    ]
+
+    for input_filename in test_filenames:
+        for battery_count, scalar_solve in [(2, d03p01.solve), (12, d03p02.solve)]:
+            expected_answer = scalar_solve(input_filename)
+            solution_answer = solve(input_filename, battery_count)
+            assert solution_answer == expected_answer, (
+                f"Test for intput {input_filename} ({battery_count} batteries) failed.\n"
+                f"Expected: {expected_answer}.\n"
+                f"Got:      {solution_answer}."
+            )
+
+
+def main() -> None:
+    print("Running tests...")
+    run_tests()
+    print("Tests ran successfuly!\n")
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("filename", nargs="?", help="puzzle input file")
+    parser.add_argument("--batteries", type=int, default=12,
+                        help="batteries turned on in every bank")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+
+    if args.filename:
+        print(f"Solving the puzzle with input {args.filename}...")
+        answer = run_with_profile(args.profile, solve, args.filename, args.batteries,
+                                  report_path=args.profile_output)
+        print(f"Answer: {answer}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,12 @@
 import argparse
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from aoc.parsing import read_bytes, read_digit_rows
+from aoc.verify import is_verified, record_verified
+from aoc.profiling import add_profile_arguments, run_with_profile
 
 PuzzleAnswer = int
 Filename = str
@@ -27,10 +35,9 @@ def maximum_joltage(bank: list[int]) -> int:
 def solve(input_filename: Filename = "d03_input.txt") -> PuzzleAnswer:
     total_maximum_joltage = 0
 
-    with open(input_filename, "r", encoding="utf-8") as file:
-        for line in file:
-            bank = [int(c) for c in line if c != '\n']
-            total_maximum_joltage += maximum_joltage(bank)
+    for digit_row in read_digit_rows(read_bytes(input_filename)):
+        bank = list(digit_row)
+        total_maximum_joltage += maximum_joltage(bank)
 
     return total_maximum_joltage
 
@@ -38,16 +45,21 @@ def solve(input_filename: Filename = "d03_input.txt") -> PuzzleAnswer:
 def run_tests() -> None:
     test_pairs: list[tuple[Filename, PuzzleAnswer]] = [
         ("d03_test_01.txt", 357),
+        ("d03_test_02.txt", 357),
         ("d03_input.txt", 16927)
     ]
 
     for input_filename, expected_answer in test_pairs:
+        if is_verified(__file__, input_filename, expected_answer):
+            continue
+
         solution_answer = solve(input_filename)
         assert solution_answer == expected_answer, (
             f"Test for intput {input_filename} failed.\n"
             f"Expected: {expected_answer}.\n"
             f"Got:      {solution_answer}."
         )
+        record_verified(__file__, input_filename, expected_answer)
 
 
 def main() -> None:
@@ -57,11 +69,13 @@ def main() -> None:
 
     parser = argparse.ArgumentParser()
     parser.add_argument("filename", nargs="?", help="puzzle input file")
+    add_profile_arguments(parser)
     args = parser.parse_args()
 
     if args.filename:
         print(f"Solving the puzzle with input {args.filename}...")
-        answer = solve(args.filename)
+        answer = run_with_profile(args.profile, solve, args.filename,
+                                  report_path=args.profile_output)
         print(f"Answer: {answer}")
 
 
@@ -1,15 +1,35 @@
 import argparse
+import mmap
+import sys
+from pathlib import Path
+from typing import Iterable, Iterator, Sequence
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from aoc.parsing import DIGIT_TABLE, read_bytes, read_digit_rows
+from aoc.verify import is_verified, record_verified
+from aoc.profiling import add_profile_arguments, run_with_profile
 
 PuzzleAnswer = int
 Filename = str
 
-def maximum_joltage(bank: list[int], battery_count: int = 12) -> int:
-    to_pick = min(len(bank), battery_count)
+STREAM_CHUNK_SIZE = 1 << 16
+
+
+def maximum_joltage(bank: Sequence[int], battery_count: int = 12) -> int:
+    return maximum_joltage_of_digits(bank, len(bank), battery_count)
+
+
+def maximum_joltage_of_digits(bank: Iterable[int], bank_length: int,
+                              battery_count: int = 12) -> int:
+    # «maximum_joltage» of a bank read once from any iterable of its digits,
+    # which is why its length has to be known upfront
+    to_pick = min(bank_length, battery_count)
 
     digits: list[int] = []
 
     for i, digit in enumerate(bank):
-        remaining = len(bank) - i
+        remaining = bank_length - i
 
         # Try to slide the new digit as much to the left as possible, without:
         # 1) Missing out on picking as much batteries as we can («to_pick»)
@@ -28,13 +48,114 @@ def maximum_joltage(bank: list[int], battery_count: int = 12) -> int:
     return max_joltage
 
 
+def joltage_removal_order(bank: list[int]) -> list[int]:
+    # Removing the batteries in this order one by one leaves the maximum
+    # joltage for every battery count along the way, since dropping the
+    # first digit which is smaller than its successor (or the last digit,
+    # if there is none) is the best single removal. Those digits are
+    # exactly the ones the monotonic stack pops, in the order it pops them.
+    removal_order: list[int] = []
+    stack: list[int] = []
+
+    for i, digit in enumerate(bank):
+        while len(stack) > 0 and digit > bank[stack[-1]]:
+            removal_order.append(stack.pop())
+        stack.append(i)
+
+    removal_order.extend(reversed(stack))
+
+    return removal_order
+
+
+def battery_keep_ranks(bank: list[int]) -> list[int]:
+    # «ranks[i]» is the smallest battery count whose maximum joltage turns
+    # on battery «i», so the optimum for «k» batteries keeps exactly the
+    # ones ranked at most «k». Batteries are put back in reverse removal
+    # order, which takes O(n) for the ranks of all of the battery counts.
+    ranks = [0] * len(bank)
+
+    for rank, i in enumerate(reversed(joltage_removal_order(bank)), start=1):
+        ranks[i] = rank
+
+    return ranks
+
+
+def joltage_from_ranks(bank: list[int], ranks: list[int], battery_count: int) -> int:
+    # «maximum_joltage(bank, battery_count)» rebuilt from the ranks in O(n)
+    joltage = 0
+
+    for digit, rank in zip(bank, ranks):
+        if rank <= battery_count:
+            joltage = (joltage * 10) + digit
+
+    return joltage
+
+
+def total_maximum_joltages(input_filename: Filename = "d03_input.txt") -> list[PuzzleAnswer]:
+    # «totals[k]» is the puzzle answer for «k» batteries per bank, shorter
+    # banks turning on all of their batteries like «maximum_joltage» does
+    banks = [list(digit_row) for digit_row in read_digit_rows(read_bytes(input_filename))]
+
+    longest_bank = max((len(bank) for bank in banks), default=0)
+    totals = [0] * (longest_bank + 1)
+    for bank in banks:
+        ranks = battery_keep_ranks(bank)
+        for battery_count in range(longest_bank + 1):
+            totals[battery_count] += joltage_from_ranks(bank, ranks, battery_count)
+
+    return totals
+
+
 def solve(input_filename: Filename = "d03_input.txt") -> PuzzleAnswer:
     total_maximum_joltage = 0
 
-    with open(input_filename, "r", encoding="utf-8") as file:
-        for line in file:
-            bank = [int(c) for c in line if c != '\n']
-            total_maximum_joltage += maximum_joltage(bank, 12)
+    for digit_row in read_digit_rows(read_bytes(input_filename)):
+        bank = list(digit_row)
+        total_maximum_joltage += maximum_joltage(bank, 12)
+
+    return total_maximum_joltage
+
+
+def read_chunked_digits(mm: mmap.mmap, start: int, end: int,
+                        chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[int]:
+    for chunk_start in range(start, end, chunk_size):
+        yield from mm[chunk_start:min(chunk_start + chunk_size, end)].translate(DIGIT_TABLE)
+
+
+def streamed_maximum_joltage(mm: mmap.mmap, start: int, end: int,
+                             battery_count: int = 12,
+                             chunk_size: int = STREAM_CHUNK_SIZE) -> int:
+    # «maximum_joltage» of the bank stored at «mm[start:end]», reading it
+    # in chunks so only the picked digits are ever kept around
+    return maximum_joltage_of_digits(read_chunked_digits(mm, start, end, chunk_size),
+                                     end - start, battery_count)
+
+
+def solve_streaming(input_filename: Filename = "d03_input.txt", battery_count: int = 12,
+                    chunk_size: int = STREAM_CHUNK_SIZE) -> PuzzleAnswer:
+    total_maximum_joltage = 0
+
+    with open(input_filename, "rb") as f:
+        if f.seek(0, 2) == 0:
+            return 0
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            line_start = 0
+            while line_start < len(mm):
+                line_end = mm.find(b"\n", line_start)
+                if line_end == -1:
+                    line_end = len(mm)
+
+                # Leave out the «\r» of Windows line endings
+                bank_end = line_end
+                if bank_end > line_start and mm[bank_end - 1] == ord("\r"):
+                    bank_end -= 1
+
+                if bank_end > line_start:
+                    total_maximum_joltage += streamed_maximum_joltage(mm, line_start, bank_end,
+                                                                      battery_count, chunk_size)
+
+                line_start = line_end + 1
 
     return total_maximum_joltage
 
@@ -42,16 +163,45 @@ def solve(input_filename: Filename = "d03_input.txt") -> PuzzleAnswer:
 def run_tests() -> None:
     test_pairs: list[tuple[Filename, PuzzleAnswer]] = [
         ("d03_test_01.txt", 3121910778619),
+        ("d03_test_02.txt", 3121910778619),
         ("d03_input.txt", 167384358365132)
     ]
 
     for input_filename, expected_answer in test_pairs:
+        if is_verified(__file__, input_filename, expected_answer):
+            continue
+
         solution_answer = solve(input_filename)
         assert solution_answer == expected_answer, (
             f"Test for intput {input_filename} failed.\n"
             f"Expected: {expected_answer}.\n"
             f"Got:      {solution_answer}."
         )
+        record_verified(__file__, input_filename, expected_answer)
+
+    for input_filename, expected_answer in test_pairs:
+        if is_verified(__file__, input_filename, expected_answer, "stream"):
+            continue
+
+        solution_answer = solve_streaming(input_filename, chunk_size=7)
+        assert solution_answer == expected_answer, (
+            f"Streaming test for intput {input_filename} failed.\n"
+            f"Expected: {expected_answer}.\n"
+            f"Got:      {solution_answer}."
+        )
+        record_verified(__file__, input_filename, expected_answer, "stream")
+
+    for digit_row in read_digit_rows(read_bytes("d03_test_01.txt")):
+        bank = list(digit_row)
+        ranks = battery_keep_ranks(bank)
+        for battery_count in range(len(bank) + 1):
+            expected_joltage = maximum_joltage(bank, battery_count)
+            solution_joltage = joltage_from_ranks(bank, ranks, battery_count)
+            assert solution_joltage == expected_joltage, (
+                f"All-k test for bank {bank} failed at {battery_count} batteries.\n"
+                f"Expected: {expected_joltage}.\n"
+                f"Got:      {solution_joltage}."
+            )
 
 
 def main() -> None:
@@ -61,11 +211,15 @@ def main() -> None:
 
     parser = argparse.ArgumentParser()
     parser.add_argument("filename", nargs="?", help="puzzle input file")
+    parser.add_argument("--stream", action="store_true",
+                        help="read the banks in chunks instead of loading the whole file")
+    add_profile_arguments(parser)
     args = parser.parse_args()
 
     if args.filename:
         print(f"Solving the puzzle with input {args.filename}...")
-        answer = solve(args.filename)
+        answer = run_with_profile(args.profile, solve_streaming if args.stream else solve, args.filename,
+                                  report_path=args.profile_output)
         print(f"Answer: {answer}")
 
 
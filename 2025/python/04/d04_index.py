@@ -0,0 +1,129 @@
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+
+import d04p01
+import d04p02
+from d04_numpy import neighbor_sums, parse_grid
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from aoc.parsing import read_bytes, read_ints
+
+DAY = "04"
+
+Filename = str
+
+# Inclusive corners «(x0, y0, x1, y1)» of a window of the grid
+Rectangle = tuple[int, int, int, int]
+
+
+class AccessibilityIndex:
+    def __init__(self, rolls: np.ndarray):
+        self.accessible = rolls & (neighbor_sums(rolls) < 4)
+
+        # «prefix_sums[y, x]» is the number of accessible rolls above and to
+        # the left of the cell «(x, y)», so row and column 0 are all zeros
+        height, width = self.accessible.shape
+        self.prefix_sums = np.zeros((height + 1, width + 1), dtype=np.int64)
+        np.cumsum(self.accessible, axis=0, out=self.prefix_sums[1:, 1:])
+        np.cumsum(self.prefix_sums[1:, 1:], axis=1, out=self.prefix_sums[1:, 1:])
+
+    @classmethod
+    def init_from_file(cls, filename: str) -> "AccessibilityIndex":
+        return cls(parse_grid(read_bytes(filename)))
+
+    def get_accessible_roll_count(self) -> int:
+        return int(self.prefix_sums[-1, -1])
+
+    def count_in_rectangle(self, x0: int, y0: int, x1: int, y1: int) -> int:
+        return int(self.count_in_rectangles(np.array([[x0, y0, x1, y1]]))[0])
+
+    def count_in_rectangles(self, rectangles: np.ndarray) -> np.ndarray:
+        # One count per row of «(x0, y0, x1, y1)» corners, with the parts
+        # of the windows outside of the grid ignored
+        height, width = self.accessible.shape
+
+        x0 = np.clip(rectangles[:, 0], 0, width)
+        y0 = np.clip(rectangles[:, 1], 0, height)
+        x1 = np.clip(rectangles[:, 2] + 1, x0, width)
+        y1 = np.clip(rectangles[:, 3] + 1, y0, height)
+
+        return (self.prefix_sums[y1, x1] - self.prefix_sums[y0, x1]
+                - self.prefix_sums[y1, x0] + self.prefix_sums[y0, x0])
+
+
+def read_rectangles(input_filename: Filename) -> np.ndarray:
+    # Four integers per window, «x0,y0,x1,y1» on every line
+    values = np.array(read_ints(read_bytes(input_filename)), dtype=np.int64)
+    if len(values) % 4 != 0:
+        raise ValueError(f"Query file {input_filename} does not hold whole rectangles")
+
+    return values.reshape(-1, 4)
+
+
+def run_tests() -> None:
+    test_filenames: list[Filename] = [
+        f"d{DAY}_test_01.txt",
+        f"d{DAY}_input.txt",
+    ]
+
+    for input_filename in test_filenames:
+        index = AccessibilityIndex.init_from_file(input_filename)
+        expected_answer = d04p01.solve(input_filename)
+        assert index.get_accessible_roll_count() == expected_answer, (
+            f"Test for intput {input_filename} failed.\n"
+            f"Expected: {expected_answer}.\n"
+            f"Got:      {index.get_accessible_roll_count()}."
+        )
+
+        grid = d04p02.RollGrid.init_from_file(input_filename)
+        accessible_positions = grid.get_accessible_roll_positions()
+
+        height, width = index.accessible.shape
+        rectangles: list[Rectangle] = [
+            (0, 0, width - 1, height - 1),
+            (1, 2, width // 2, height // 3),
+            (width // 3, height // 4, width - 2, height - 1),
+            (-5, -5, 3, 3),
+            (4, 4, 3, 9),
+        ]
+        counts = index.count_in_rectangles(np.array(rectangles))
+        for (x0, y0, x1, y1), count in zip(rectangles, counts):
+            expected_count = sum(1 for x, y in accessible_positions
+                                 if x0 <= x <= x1 and y0 <= y <= y1)
+            assert count == expected_count, (
+                f"Window ({x0}, {y0}, {x1}, {y1}) for intput {input_filename} failed.\n"
+                f"Expected: {expected_count}.\n"
+                f"Got:      {count}."
+            )
+
+
+def main() -> None:
+    print("Running tests...")
+    run_tests()
+    print("Tests ran successfuly!\n")
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("filename", nargs="?", help="puzzle input file")
+    parser.add_argument("--rect", type=int, nargs=4, metavar=("X0", "Y0", "X1", "Y1"),
+                        help="count the accessible rolls in one window (inclusive corners)")
+    parser.add_argument("--queries", metavar="FILE",
+                        help="file with one x0,y0,x1,y1 window per line")
+    args = parser.parse_args()
+
+    if args.filename:
+        index = AccessibilityIndex.init_from_file(args.filename)
+        print(f"Indexed {index.get_accessible_roll_count()} accessible rolls of {args.filename}.")
+
+        if args.rect is not None:
+            print(f"Accessible rolls in {tuple(args.rect)}: {index.count_in_rectangle(*args.rect)}")
+        if args.queries is not None:
+            for count in index.count_in_rectangles(read_rectangles(args.queries)):
+                print(count)
+
+
+if __name__ == "__main__":
+    main()
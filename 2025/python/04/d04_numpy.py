@@ -0,0 +1,186 @@
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+
+import d04p01
+import d04p02
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from aoc.parsing import read_bytes
+from aoc.profiling import add_profile_arguments, run_with_profile
+
+DAY = "04"
+
+PuzzleAnswer = int
+Filename = str
+
+NEIGHBOR_OFFSETS = d04p02.NEIGHBOR_OFFSETS
+ROLL = d04p02.ROLL
+
+# Rounds removing fewer than one in this many cells only visit the
+# neighbourhood of the previous round's removals
+SPARSE_ROUND_RATIO = 256
+
+
+def parse_grid(data: bytes) -> np.ndarray:
+    data = data.rstrip(b"\n")
+    if len(data) == 0:
+        return np.zeros((0, 0), dtype=bool)
+
+    width = data.find(b"\n")
+    if width == -1:
+        width = len(data)
+
+    height = (len(data) + 1) // (width + 1)
+    if height * (width + 1) != len(data) + 1:
+        raise ValueError("Grid rows must all have the same width")
+
+    # The line breaks end up as an extra column, which is dropped
+    cells = np.frombuffer(data + b"\n", dtype=np.uint8).reshape(height, width + 1)
+
+    return cells[:, :width] == ord(ROLL)
+
+
+Slices = tuple[slice, slice]
+
+
+def get_shift_slices(height: int, width: int, dx: int, dy: int) -> tuple[Slices, Slices]:
+    # Slices pairing every cell with its neighbour at offset «(dx, dy)»,
+    # leaving out the pairs which fall off the grid
+    return ((slice(max(dy, 0), height + min(dy, 0)), slice(max(dx, 0), width + min(dx, 0))),
+            (slice(max(-dy, 0), height + min(-dy, 0)), slice(max(-dx, 0), width + min(-dx, 0))))
+
+
+def neighbor_sums(cells: np.ndarray) -> np.ndarray:
+    # Number of set cells among the 8 neighbours of every cell, as a sum
+    # of the grid shifted in every direction
+    cells = cells.view(np.uint8)
+
+    height, width = cells.shape
+    sums = np.zeros((height, width), dtype=np.uint8)
+    for dx, dy in NEIGHBOR_OFFSETS:
+        target, source = get_shift_slices(height, width, dx, dy)
+        sums[target] += cells[source]
+
+    return sums
+
+
+class ArrayRollGrid:
+    def __init__(self, rolls: np.ndarray):
+        self.rolls = rolls
+        self.neighbor_counts = neighbor_sums(rolls)
+
+    @classmethod
+    def init_from_file(cls, filename: str) -> "ArrayRollGrid":
+        return cls(parse_grid(read_bytes(filename)))
+
+    def get_accessible_mask(self) -> np.ndarray:
+        return self.rolls & (self.neighbor_counts < 4)
+
+    def get_accessible_roll_count(self) -> int:
+        return int(np.count_nonzero(self.get_accessible_mask()))
+
+    def remove_rolls(self, removed_mask: np.ndarray) -> None:
+        # Only the neighbours of the removed rolls lose anything, so the
+        # counts are updated rather than recomputed
+        self.rolls &= ~removed_mask
+
+        removed = removed_mask.view(np.uint8)
+        height, width = removed.shape
+        for dx, dy in NEIGHBOR_OFFSETS:
+            target, source = get_shift_slices(height, width, dx, dy)
+            self.neighbor_counts[target] -= removed[source]
+
+    def remove_accessible_rolls_step(self) -> int:
+        accessible = self.get_accessible_mask()
+        self.remove_rolls(accessible)
+
+        return int(np.count_nonzero(accessible))
+
+    def remove_accessible_rolls_full(self) -> int:
+        total_removed = 0
+        height, width = self.rolls.shape
+
+        # Whole-array rounds while they remove a large share of the grid
+        accessible = self.get_accessible_mask()
+        removed_count = int(np.count_nonzero(accessible))
+        while removed_count > self.rolls.size // SPARSE_ROUND_RATIO:
+            total_removed += removed_count
+            self.remove_rolls(accessible)
+
+            accessible = self.get_accessible_mask()
+            removed_count = int(np.count_nonzero(accessible))
+
+        # Later rounds only touch the neighbours of the previous round's
+        # rolls, since nothing else can have become accessible
+        rolls = self.rolls.ravel()
+        neighbor_counts = self.neighbor_counts.ravel()
+
+        ys, xs = np.nonzero(accessible)
+        while len(ys) > 0:
+            total_removed += len(ys)
+            rolls[ys * width + xs] = False
+
+            neighbor_cells: list[np.ndarray] = []
+            for dx, dy in NEIGHBOR_OFFSETS:
+                nys, nxs = ys + dy, xs + dx
+                on_grid = (nys >= 0) & (nys < height) & (nxs >= 0) & (nxs < width)
+                neighbor_cells.append(nys[on_grid] * width + nxs[on_grid])
+
+            cells, lost_rolls = np.unique(np.concatenate(neighbor_cells), return_counts=True)
+            neighbor_counts[cells] -= lost_rolls.astype(np.uint8)
+
+            ys, xs = np.divmod(cells[rolls[cells] & (neighbor_counts[cells] < 4)], width)
+
+        return total_removed
+
+
+def solve(input_filename: Filename = f"d{DAY}_input.txt", part: int = 2) -> PuzzleAnswer:
+    grid = ArrayRollGrid.init_from_file(input_filename)
+
+    if part == 1:
+        return grid.get_accessible_roll_count()
+
+    return grid.remove_accessible_rolls_full()
+
+
+def run_tests() -> None:
+    test_filenames: list[Filename] = [
+        f"d{DAY}_test_01.txt",
+        f"d{DAY}_input.txt",
+    ]
+
+    for input_filename in test_filenames:
+        for part, scalar_solve in [(1, d04p01.solve), (2, d04p02.solve)]:
+            expected_answer = scalar_solve(input_filename)
+            solution_answer = solve(input_filename, part)
+            assert solution_answer == expected_answer, (
+                f"Test for intput {input_filename} (part {part}) failed.\n"
+                f"Expected: {expected_answer}.\n"
+                f"Got:      {solution_answer}."
+            )
+
+
+def main() -> None:
+    print("Running tests...")
+    run_tests()
+    print("Tests ran successfuly!\n")
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("filename", nargs="?", help="puzzle input file")
+    parser.add_argument("--part", type=int, choices=[1, 2], default=2)
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+
+    if args.filename:
+        print(f"Solving the puzzle with input {args.filename}...")
+        answer = run_with_profile(args.profile, solve, args.filename, args.part,
+                                  report_path=args.profile_output)
+        print(f"Answer: {answer}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+
+import numpy as np
+
+import d04p02
+from d04_numpy import neighbor_sums, parse_grid
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from aoc.parsing import read_bytes
+from aoc.profiling import add_profile_arguments, run_with_profile
+
+DAY = "04"
+
+PuzzleAnswer = int
+Filename = str
+
+RowBand = tuple[int, int]
+
+# Grid buffers of the current worker process, attached once by «attach_grids»
+_worker_memories: list[SharedMemory] = []
+_worker_grids: list[np.ndarray] = []
+
+
+def get_bands(height: int, band_count: int) -> list[RowBand]:
+    band_count = max(1, min(band_count, height))
+    boundaries = [height * band_i // band_count for band_i in range(band_count + 1)]
+
+    return list(zip(boundaries, boundaries[1:]))
+
+
+def attach_grids(memory_names: list[str], shape: tuple[int, int]) -> None:
+    for memory_name in memory_names:
+        memory = SharedMemory(name=memory_name)
+        _worker_memories.append(memory)
+        _worker_grids.append(np.ndarray(shape, dtype=bool, buffer=memory.buf))
+
+
+def remove_band_step(band: RowBand, source_i: int) -> int:
+    # One round of removals for the rows of «band», reading the grid before
+    # the round from one buffer and writing the band's rows after it into
+    # the other. The rows just outside the band are the halo, which the
+    # neighbouring bands wrote during the previous round.
+    source = _worker_grids[source_i]
+    target = _worker_grids[1 - source_i]
+    band_start, band_end = band
+
+    halo_start = max(band_start - 1, 0)
+    halo_end = min(band_end + 1, source.shape[0])
+    slab = source[halo_start:halo_end]
+
+    accessible = slab & (neighbor_sums(slab) < 4)
+    band_rows = slice(band_start - halo_start, band_end - halo_start)
+
+    target[band_start:band_end] = slab[band_rows] & ~accessible[band_rows]
+
+    return int(np.count_nonzero(accessible[band_rows]))
+
+
+def remove_accessible_rolls_tiled(rolls: np.ndarray, workers: int | None = None,
+                                  band_count: int | None = None) -> int:
+    if rolls.size == 0:
+        return 0
+
+    if band_count is None:
+        band_count = 4 * (workers or os.cpu_count() or 1)
+    bands = get_bands(rolls.shape[0], band_count)
+
+    # Double buffering: every round reads one grid and writes the other
+    memories = [SharedMemory(create=True, size=rolls.nbytes) for _ in range(2)]
+    try:
+        for memory in memories:
+            np.ndarray(rolls.shape, dtype=bool, buffer=memory.buf)[:] = rolls
+
+        total_removed = 0
+        with ProcessPoolExecutor(max_workers=workers, initializer=attach_grids,
+                                 initargs=([memory.name for memory in memories],
+                                           rolls.shape)) as executor:
+            source_i = 0
+            changed = [True] * len(bands)
+            while any(changed):
+                # A band can only lose rolls if it or one of its neighbours
+                # did in the previous round, otherwise both buffers already
+                # hold the same rows for it
+                active = [band_i for band_i in range(len(bands))
+                          if any(changed[max(band_i - 1, 0):band_i + 2])]
+
+                removed_counts = executor.map(remove_band_step,
+                                              [bands[band_i] for band_i in active],
+                                              [source_i] * len(active))
+
+                changed = [False] * len(bands)
+                for band_i, removed_count in zip(active, removed_counts):
+                    changed[band_i] = removed_count > 0
+                    total_removed += removed_count
+
+                source_i = 1 - source_i
+    finally:
+        for memory in memories:
+            memory.close()
+            memory.unlink()
+
+    return total_removed
+
+
+def solve(input_filename: Filename = f"d{DAY}_input.txt", workers: int | None = None,
+          band_count: int | None = None) -> PuzzleAnswer:
+    rolls = parse_grid(read_bytes(input_filename))
+
+    return remove_accessible_rolls_tiled(rolls, workers, band_count)
+
+
+def run_tests() -> None:
+    test_filenames: list[Filename] = [
+        f"d{DAY}_test_01.txt",
+        f"d{DAY}_input.txt",
+    ]
+
+    for input_filename in test_filenames:
+        expected_answer = d04p02.RollGrid.init_from_file(input_filename).remove_accessible_rolls_full()
+        solution_answer = solve(input_filename, workers=2, band_count=7)
+        assert solution_answer == expected_answer, (
+            f"Test for intput {input_filename} failed.\n"
+            f"Expected: {expected_answer}.\n"
+            f"Got:      {solution_answer}."
+        )
+
+
+def main() -> None:
+    print("Running tests...")
+    run_tests()
+    print("Tests ran successfuly!\n")
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("filename", nargs="?", help="puzzle input file")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker process count (CPU count by default)")
+    parser.add_argument("--bands", type=int, default=None,
+                        help="number of row bands the grid is split into")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+
+    if args.filename:
+        print(f"Solving the puzzle with input {args.filename}...")
+        answer = run_with_profile(args.profile, solve, args.filename, args.workers,
+                                  args.bands, report_path=args.profile_output)
+        print(f"Answer: {answer}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,12 @@
 import argparse
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from aoc.parsing import find_char_positions, read_bytes
+from aoc.verify import is_verified, record_verified
+from aoc.profiling import add_profile_arguments, run_with_profile
 
 DAY = "04"
 
@@ -20,15 +28,9 @@ class RollGrid:
 
     @classmethod
     def init_from_file(cls, filename: str) -> "RollGrid":
-        roll_positions: set[Position] = set()
+        xs, ys = find_char_positions(read_bytes(filename), ROLL.encode())
 
-        with open(filename, "r", encoding="utf-8") as file:
-            for y, line in enumerate(file):
-                for x, ch in enumerate(line):
-                    if ch == ROLL:
-                        roll_positions.add((x, y))
-
-        return cls(roll_positions)
+        return cls(set(zip(xs, ys)))
 
     def get_accessible_roll_count(self) -> int:
         accessible_rolls = 0
@@ -59,12 +61,16 @@ def run_tests() -> None:
     ]
 
     for input_filename, expected_answer in test_pairs:
+        if is_verified(__file__, input_filename, expected_answer):
+            continue
+
         solution_answer = solve(input_filename)
         assert solution_answer == expected_answer, (
             f"Test for intput {input_filename} failed.\n"
             f"Expected: {expected_answer}.\n"
             f"Got:      {solution_answer}."
         )
+        record_verified(__file__, input_filename, expected_answer)
 
 
 def main() -> None:
@@ -74,11 +80,13 @@ def main() -> None:
 
     parser = argparse.ArgumentParser()
     parser.add_argument("filename", nargs="?", help="puzzle input file")
+    add_profile_arguments(parser)
     args = parser.parse_args()
 
     if args.filename:
         print(f"Solving the puzzle with input {args.filename}...")
-        answer = solve(args.filename)
+        answer = run_with_profile(args.profile, solve, args.filename,
+                                  report_path=args.profile_output)
         print(f"Answer: {answer}")
 
 
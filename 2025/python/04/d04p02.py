@@ -1,4 +1,14 @@
 import argparse
+import bisect
+import sys
+from array import array
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from aoc.parsing import find_char_positions, read_bytes
+from aoc.verify import is_verified, record_verified
+from aoc.profiling import add_profile_arguments, run_with_profile
 
 DAY = "04"
 
@@ -12,6 +22,9 @@ NEIGHBOR_OFFSETS = [(-1, -1), (0, -1), (1, -1),
                     (-1, 1), (0, 1), (1, 1)]
 ROLL = '@'
 
+# Removal round of the rolls which are never removed, for each array typecode
+NEVER_BY_TYPECODE = {"H": 0xFFFF, "L": 0xFFFFFFFF}
+
 
 class RollGrid:
     def __init__(self, roll_positions: set[Position]):
@@ -19,15 +32,9 @@ class RollGrid:
 
     @classmethod
     def init_from_file(cls, filename: str) -> "RollGrid":
-        roll_positions: set[Position] = set()
+        xs, ys = find_char_positions(read_bytes(filename), ROLL.encode())
 
-        with open(filename, "r", encoding="utf-8") as file:
-            for y, line in enumerate(file):
-                for x, ch in enumerate(line):
-                    if ch == ROLL:
-                        roll_positions.add((x, y))
-
-        return cls(roll_positions)
+        return cls(set(zip(xs, ys)))
 
     def is_accessible(self, position: Position) -> bool:
         x, y = position
@@ -72,11 +79,124 @@ class RollGrid:
 
         return total_removed
 
+    def get_neighbor_counts(self) -> dict[Position, int]:
+        neighbor_counts: dict[Position, int] = {}
+
+        for x, y in self.roll_positions:
+            adjacent_rolls = 0
+            for dx, dy in NEIGHBOR_OFFSETS:
+                if (x + dx, y + dy) in self.roll_positions:
+                    adjacent_rolls += 1
+
+            neighbor_counts[(x, y)] = adjacent_rolls
+
+        return neighbor_counts
+
+    def remove_accessible_rolls_peeling(self) -> int:
+        # Removing a roll only ever lowers its neighbours' counts, so the
+        # rolls can be peeled off one at a time in any order and still end
+        # up with the same grid as removing them round by round
+        neighbor_counts = self.get_neighbor_counts()
+        worklist = [pos for pos, count in neighbor_counts.items() if count < 4]
+
+        total_removed = 0
+        while len(worklist) > 0:
+            x, y = worklist.pop()
+            self.roll_positions.remove((x, y))
+            del neighbor_counts[(x, y)]
+            total_removed += 1
+
+            for dx, dy in NEIGHBOR_OFFSETS:
+                neighbor = (x + dx, y + dy)
+                if neighbor in neighbor_counts:
+                    neighbor_counts[neighbor] -= 1
+
+                    # Every roll is queued exactly once, when it first
+                    # becomes accessible
+                    if neighbor_counts[neighbor] == 3:
+                        worklist.append(neighbor)
+
+        return total_removed
+
+
+    def get_removal_timeline(self) -> "RemovalTimeline":
+        # Same peeling as «remove_accessible_rolls_peeling», but level by
+        # level and without touching the grid: a roll becomes accessible
+        # in the round after the one which took its neighbour count below 4
+        positions = sorted(self.roll_positions)
+        position_indices = {pos: i for i, pos in enumerate(positions)}
+
+        neighbor_counts = self.get_neighbor_counts()
+        typecode = "H" if len(positions) < NEVER_BY_TYPECODE["H"] else "L"
+        removal_rounds = array(typecode, [NEVER_BY_TYPECODE[typecode]]) * len(positions)
+
+        current_round = 1
+        level = [pos for pos in positions if neighbor_counts[pos] < 4]
+        while len(level) > 0:
+            for pos in level:
+                removal_rounds[position_indices[pos]] = current_round
+                del neighbor_counts[pos]
+
+            next_level: list[Position] = []
+            for x, y in level:
+                for dx, dy in NEIGHBOR_OFFSETS:
+                    neighbor = (x + dx, y + dy)
+                    if neighbor in neighbor_counts:
+                        neighbor_counts[neighbor] -= 1
+                        if neighbor_counts[neighbor] == 3:
+                            next_level.append(neighbor)
+
+            level = next_level
+            current_round += 1
+
+        return RemovalTimeline(positions, removal_rounds)
+
+
+class RemovalTimeline:
+    # «removal_rounds[i]» is the round in which «positions[i]» is removed
+    # (counting from 1), or «never» if it stays till the end
+    def __init__(self, positions: list[Position], removal_rounds: array):
+        self.positions = positions
+        self.removal_rounds = removal_rounds
+        self.never = NEVER_BY_TYPECODE[removal_rounds.typecode]
+
+        self.round_count = max((r for r in removal_rounds if r != self.never), default=0)
+
+        # «removed_counts[r]» is the number of rolls removed in round «r»
+        self.removed_counts = [0] * (self.round_count + 1)
+        for r in removal_rounds:
+            if r != self.never:
+                self.removed_counts[r] += 1
+
+    def get_removed_count(self, round_i: int) -> int:
+        if round_i < 1 or round_i > self.round_count:
+            return 0
+
+        return self.removed_counts[round_i]
+
+    def get_total_removed(self, round_i: int | None = None) -> int:
+        # Rolls removed in the first «round_i» rounds, all of them by default
+        if round_i is None:
+            round_i = self.round_count
+
+        return sum(self.removed_counts[:max(round_i, 0) + 1])
+
+    def get_roll_positions_after(self, round_i: int) -> set[Position]:
+        return {pos for pos, r in zip(self.positions, self.removal_rounds) if r > round_i}
+
+    def is_removed_by(self, position: Position, round_i: int) -> bool:
+        i = bisect.bisect_left(self.positions, position)
+        if i == len(self.positions) or self.positions[i] != position:
+            return False
+
+        return self.removal_rounds[i] <= round_i
+
 
 def solve(input_filename: Filename = "d03_input.txt") -> PuzzleAnswer:
     grid = RollGrid.init_from_file(input_filename)
 
-    return grid.remove_accessible_rolls_full()
+    # return grid.remove_accessible_rolls_full()
+    return grid.remove_accessible_rolls_peeling()
 
 
 def run_tests() -> None:
@@ -86,12 +206,37 @@ def run_tests() -> None:
     ]
 
     for input_filename, expected_answer in test_pairs:
+        if is_verified(__file__, input_filename, expected_answer):
+            continue
+
         solution_answer = solve(input_filename)
         assert solution_answer == expected_answer, (
             f"Test for intput {input_filename} failed.\n"
             f"Expected: {expected_answer}.\n"
             f"Got:      {solution_answer}."
         )
+        record_verified(__file__, input_filename, expected_answer)
+
+    input_filename = f"d{DAY}_test_01.txt"
+    timeline = RollGrid.init_from_file(input_filename).get_removal_timeline()
+    grid = RollGrid.init_from_file(input_filename)
+    for round_i in range(1, timeline.round_count + 2):
+        expected_count = grid.remove_accessible_rolls_step()
+        assert timeline.get_removed_count(round_i) == expected_count, (
+            f"Timeline test for intput {input_filename} failed at round {round_i}.\n"
+            f"Expected: {expected_count}.\n"
+            f"Got:      {timeline.get_removed_count(round_i)}."
+        )
+        assert timeline.get_roll_positions_after(round_i) == grid.roll_positions
+
+    input_filename = f"d{DAY}_test_01.txt"
+    expected_answer = RollGrid.init_from_file(input_filename).remove_accessible_rolls_full()
+    solution_answer = RollGrid.init_from_file(input_filename).remove_accessible_rolls_peeling()
+    assert solution_answer == expected_answer, (
+        f"Peeling test for intput {input_filename} failed.\n"
+        f"Expected: {expected_answer}.\n"
+        f"Got:      {solution_answer}."
+    )
 
 
 def main() -> None:
@@ -101,11 +246,13 @@ def main() -> None:
 
     parser = argparse.ArgumentParser()
     parser.add_argument("filename", nargs="?", help="puzzle input file")
+    add_profile_arguments(parser)
     args = parser.parse_args()
 
     if args.filename:
         print(f"Solving the puzzle with input {args.filename}...")
-        answer = solve(args.filename)
+        answer = run_with_profile(args.profile, solve, args.filename,
+                                  report_path=args.profile_output)
         print(f"Answer: {answer}")
 
 
@@ -0,0 +1,132 @@
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+import d05p01
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from aoc.parsing import read_bytes
+from aoc.profiling import add_profile_arguments, run_with_profile
+
+DAY = "05"
+
+PuzzleAnswer = int
+Filename = str
+
+# IDs classified at once, which bounds the temporaries for mapped files
+CHUNK_SIZE = 1 << 22
+
+
+def split_input(data: bytes) -> tuple[bytes, bytes]:
+    # The ranges and the ingredient IDs are separated by an empty line
+    ranges_data, _, ids_data = data.replace(b"\r\n", b"\n").partition(b"\n\n")
+
+    return ranges_data, ids_data
+
+
+def parse_boundaries(ranges_data: bytes) -> np.ndarray:
+    # Merged ranges as «[low_0, high_0 + 1, low_1, high_1 + 1, ...]», so an
+    # ID is fresh exactly when an odd number of boundaries are at or below it
+    intervals = [d05p01.Interval(int(low), int(high))
+                 for low, high in d05p01.RANGE_PATTERN.findall(ranges_data)]
+    interval_index = d05p01.StaticIntervalIndex.from_intervals(intervals)
+
+    boundaries = np.empty(2 * len(interval_index.lows), dtype=np.int64)
+    boundaries[0::2] = interval_index.lows
+    boundaries[1::2] = np.array(interval_index.highs, dtype=np.int64) + 1
+
+    return boundaries
+
+
+def read_ids(ids_filename: Filename) -> np.ndarray:
+    # Either a NumPy array file, which is mapped rather than loaded, or
+    # a puzzle input or plain list with one ID per line
+    if ids_filename.endswith(".npy"):
+        return np.load(ids_filename, mmap_mode="r")
+
+    ranges_data, ids_data = split_input(read_bytes(ids_filename))
+    if len(ids_data) == 0 and d05p01.RANGE_PATTERN.search(ranges_data) is None:
+        ids_data = ranges_data
+
+    # Trailing empty lines would otherwise be parsed as a phantom ID 0
+    ids_data = ids_data.strip()
+    if len(ids_data) == 0:
+        return np.empty(0, dtype=np.int64)
+
+    return np.fromstring(ids_data, dtype=np.int64, sep="\n")
+
+
+def count_fresh(ids: np.ndarray, boundaries: np.ndarray, chunk_size: int = CHUNK_SIZE) -> int:
+    fresh_id_count = 0
+
+    for chunk_start in range(0, len(ids), chunk_size):
+        chunk = ids[chunk_start:chunk_start + chunk_size]
+        boundary_counts = np.searchsorted(boundaries, chunk, side="right")
+        fresh_id_count += int(np.count_nonzero(boundary_counts & 1))
+
+    return fresh_id_count
+
+
+def solve(input_filename: Filename = f"d{DAY}_input.txt",
+          ids_filename: Filename | None = None) -> PuzzleAnswer:
+    ranges_data, _ = split_input(read_bytes(input_filename))
+    boundaries = parse_boundaries(ranges_data)
+
+    ids = read_ids(ids_filename or input_filename)
+
+    return count_fresh(ids, boundaries)
+
+
+def run_tests() -> None:
+    test_filenames: list[Filename] = [
+        f"d{DAY}_test_01.txt",
+        f"d{DAY}_test_02.txt",
+        f"d{DAY}_input.txt",
+    ]
+
+    for input_filename in test_filenames:
+        expected_answer = d05p01.solve(input_filename)
+        solution_answer = solve(input_filename)
+        assert solution_answer == expected_answer, (
+            f"Test for intput {input_filename} failed.\n"
+            f"Expected: {expected_answer}.\n"
+            f"Got:      {solution_answer}."
+        )
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            ids_filename = str(Path(tmp_dir) / "ids.npy")
+            np.save(ids_filename, read_ids(input_filename))
+
+            solution_answer = solve(input_filename, ids_filename)
+            assert solution_answer == expected_answer, (
+                f"Mapped test for intput {input_filename} failed.\n"
+                f"Expected: {expected_answer}.\n"
+                f"Got:      {solution_answer}."
+            )
+
+
+def main() -> None:
+    print("Running tests...")
+    run_tests()
+    print("Tests ran successfuly!\n")
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("filename", nargs="?", help="puzzle input file")
+    parser.add_argument("--ids", default=None,
+                        help="separate ID file, one per line or a .npy array")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+
+    if args.filename:
+        print(f"Solving the puzzle with input {args.filename}...")
+        answer = run_with_profile(args.profile, solve, args.filename, args.ids,
+                                  report_path=args.profile_output)
+        print(f"Answer: {answer}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,24 @@
 import argparse
+import bisect
+import re
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from aoc.cache import cached_parser
+from aoc.parsing import read_bytes
+from aoc.verify import is_verified, record_verified
+from aoc.profiling import add_profile_arguments, run_with_profile
 
 DAY = "05"
 
 PuzzleAnswer = int
 Filename = str
 
+RANGE_PATTERN = re.compile(rb"^(\d+)-(\d+)\r?$", re.MULTILINE)
+POINT_PATTERN = re.compile(rb"^(\d+)\r?$", re.MULTILINE)
+
 
 class Interval:
     def __init__(self, low: int, high: int):
@@ -73,27 +87,77 @@ class IntervalTree:
         self.root.insert(interval)
 
 
+class StaticIntervalIndex:
+    # Disjoint intervals as parallel lists of bounds sorted by «lows», so a
+    # point can only be inside the last interval starting at or before it
+    def __init__(self, lows: list[int], highs: list[int]):
+        self.lows = lows
+        self.highs = highs
+
+    @classmethod
+    def from_intervals(cls, intervals: list[Interval]) -> "StaticIntervalIndex":
+        merged = merge_intervals(intervals)
+
+        return cls([interval.low for interval in merged],
+                   [interval.high for interval in merged])
+
+    def contains(self, point: int) -> bool:
+        i = bisect.bisect_right(self.lows, point) - 1
+
+        return i >= 0 and point <= self.highs[i]
+
+
+def merge_intervals(intervals: list[Interval]) -> list[Interval]:
+    if len(intervals) == 0:
+        return []
+
+    merged: list[Interval] = []
+
+    sorted_intervals = sorted(intervals, key=lambda interval: interval.low)
+    current_interval = sorted_intervals[0]
+    for i in range(1, len(sorted_intervals)):
+        next_interval = sorted_intervals[i]
+        if current_interval.intersects(next_interval):
+            current_interval.high = max(current_interval.high,
+                                        next_interval.high)
+        else:
+            merged.append(current_interval)
+            current_interval = next_interval
+    merged.append(current_interval)
+
+    return merged
+
+
+@cached_parser(f"d{DAY}")
+def parse_input(input_filename: str) -> tuple[list[tuple[int, int]], list[int]]:
+    data = read_bytes(input_filename)
+
+    ranges = [(int(low), int(high)) for low, high in RANGE_PATTERN.findall(data)]
+    points = [int(point) for point in POINT_PATTERN.findall(data)]
+
+    return (ranges, points)
+
+
 def read_input(input_filename: str) -> tuple[IntervalTree, list[int]]:
+    ranges, points = parse_input(input_filename)
+
     interval_tree = IntervalTree()
-    points: list[int] = []
-
-    with open(input_filename, "r", encoding="utf-8") as file:
-        for line in file:
-            line = line.strip()
-            if line == "":
-                continue
-
-            if "-" in line:
-                low, high = map(int, line.split("-"))
-                interval = Interval(low, high)
-                interval_tree.insert(interval)
-            else:
-                points.append(int(line))
+    for low, high in ranges:
+        interval_tree.insert(Interval(low, high))
 
     return (interval_tree, points)
 
 
-def solve(input_filename: Filename = "d03_input.txt") -> PuzzleAnswer:
+def read_input_index(input_filename: str) -> tuple[StaticIntervalIndex, list[int]]:
+    ranges, points = parse_input(input_filename)
+
+    interval_index = StaticIntervalIndex.from_intervals([Interval(low, high)
+                                                         for low, high in ranges])
+
+    return (interval_index, points)
+
+
+def solve_tree(input_filename: Filename = f"d{DAY}_input.txt") -> PuzzleAnswer:
     interval_tree, ingredient_ids = read_input(input_filename)
 
     fresh_id_count = 0
@@ -106,6 +170,18 @@ def solve(input_filename: Filename = "d03_input.txt") -> PuzzleAnswer:
     return fresh_id_count
 
 
+def solve(input_filename: Filename = f"d{DAY}_input.txt") -> PuzzleAnswer:
+    interval_index, ingredient_ids = read_input_index(input_filename)
+
+    fresh_id_count = 0
+
+    for ingredient_id in ingredient_ids:
+        if interval_index.contains(ingredient_id):
+            fresh_id_count += 1
+
+    return fresh_id_count
+
+
 def run_tests() -> None:
     test_pairs: list[tuple[Filename, PuzzleAnswer]] = [
         (f"d{DAY}_test_01.txt", 3),
@@ -113,12 +189,25 @@ def run_tests() -> None:
     ]
 
     for input_filename, expected_answer in test_pairs:
+        if is_verified(__file__, input_filename, expected_answer):
+            continue
+
         solution_answer = solve(input_filename)
         assert solution_answer == expected_answer, (
             f"Test for intput {input_filename} failed.\n"
             f"Expected: {expected_answer}.\n"
             f"Got:      {solution_answer}."
         )
+        record_verified(__file__, input_filename, expected_answer)
+
+    input_filename = f"d{DAY}_test_01.txt"
+    expected_answer = solve_tree(input_filename)
+    solution_answer = solve(input_filename)
+    assert solution_answer == expected_answer, (
+        f"Index test for intput {input_filename} failed.\n"
+        f"Expected: {expected_answer}.\n"
+        f"Got:      {solution_answer}."
+    )
 
 
 def main() -> None:
@@ -128,11 +217,13 @@ def main() -> None:
 
     parser = argparse.ArgumentParser()
     parser.add_argument("filename", nargs="?", help="puzzle input file")
+    add_profile_arguments(parser)
     args = parser.parse_args()
 
     if args.filename:
         print(f"Solving the puzzle with input {args.filename}...")
-        answer = solve(args.filename)
+        answer = run_with_profile(args.profile, solve, args.filename,
+                                  report_path=args.profile_output)
         print(f"Answer: {answer}")
 
 
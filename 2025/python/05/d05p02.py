@@ -1,10 +1,25 @@
 import argparse
+import bisect
+import re
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from aoc.cache import cached_parser, shares_cache_entries
+from aoc.parsing import read_bytes
+from aoc.verify import is_verified, record_verified
+from aoc.profiling import add_profile_arguments, run_with_profile
+from aoc.runner import load_module
 
 DAY = "05"
 
 PuzzleAnswer = int
 Filename = str
 
+RANGE_PATTERN = re.compile(rb"^(\d+)-(\d+)\r?$", re.MULTILINE)
+POINT_PATTERN = re.compile(rb"^(\d+)\r?$", re.MULTILINE)
+
 
 class Interval:
     def __init__(self, low: int, high: int):
@@ -24,21 +39,20 @@ class Interval:
         return self.low <= interval.high and interval.low <= self.high
 
 
-def read_input(input_filename: str) -> list[Interval]:
-    intervals: list[Interval] = []
+@cached_parser(f"d{DAY}")
+def parse_input(input_filename: str) -> tuple[list[tuple[int, int]], list[int]]:
+    data = read_bytes(input_filename)
 
-    with open(input_filename, "r", encoding="utf-8") as file:
-        for line in file:
-            line = line.strip()
-            if line == "":
-                continue
+    ranges = [(int(low), int(high)) for low, high in RANGE_PATTERN.findall(data)]
+    points = [int(point) for point in POINT_PATTERN.findall(data)]
 
-            if "-" in line:
-                low, high = map(int, line.split("-"))
-                interval = Interval(low, high)
-                intervals.append(interval)
+    return (ranges, points)
 
-    return intervals
+
+def read_input(input_filename: str) -> list[Interval]:
+    ranges, _ = parse_input(input_filename)
+
+    return [Interval(low, high) for low, high in ranges]
 
 
 def merge_intervals(intervals: list[Interval]) -> list[Interval]:
@@ -62,6 +76,74 @@ def merge_intervals(intervals: list[Interval]) -> list[Interval]:
     return merged
 
 
+class IntervalSet:
+    # Disjoint, non-adjacent intervals as parallel lists of bounds sorted
+    # by «lows», with the number of covered IDs kept up to date
+    def __init__(self) -> None:
+        self.lows: list[int] = []
+        self.highs: list[int] = []
+        self.size = 0
+
+    def get_size(self) -> int:
+        return self.size
+
+    def contains(self, point: int) -> bool:
+        i = bisect.bisect_right(self.lows, point) - 1
+
+        return i >= 0 and point <= self.highs[i]
+
+    def add(self, low: int, high: int) -> None:
+        # Intervals «[i, j)» overlap or touch the new one and merge into it
+        i = bisect.bisect_left(self.highs, low - 1)
+        j = bisect.bisect_right(self.lows, high + 1)
+
+        if i < j:
+            low = min(low, self.lows[i])
+            high = max(high, self.highs[j - 1])
+
+        for k in range(i, j):
+            self.size -= self.highs[k] - self.lows[k] + 1
+        self.size += high - low + 1
+
+        self.lows[i:j] = [low]
+        self.highs[i:j] = [high]
+
+    def remove(self, low: int, high: int) -> None:
+        # Intervals «[i, j)» overlap the removed one, only the parts of the
+        # first and the last one sticking out of it are kept
+        i = bisect.bisect_left(self.highs, low)
+        j = bisect.bisect_right(self.lows, high)
+        if i >= j:
+            return
+
+        kept_lows: list[int] = []
+        kept_highs: list[int] = []
+        if self.lows[i] < low:
+            kept_lows.append(self.lows[i])
+            kept_highs.append(low - 1)
+        if self.highs[j - 1] > high:
+            kept_lows.append(high + 1)
+            kept_highs.append(self.highs[j - 1])
+
+        for k in range(i, j):
+            self.size -= self.highs[k] - self.lows[k] + 1
+        for kept_low, kept_high in zip(kept_lows, kept_highs):
+            self.size += kept_high - kept_low + 1
+
+        self.lows[i:j] = kept_lows
+        self.highs[i:j] = kept_highs
+
+
+def solve_dynamic(input_filename: Filename = f"d{DAY}_input.txt") -> PuzzleAnswer:
+    ranges, _ = parse_input(input_filename)
+
+    interval_set = IntervalSet()
+    for low, high in ranges:
+        interval_set.add(low, high)
+
+    return interval_set.get_size()
+
+
 def solve(input_filename: Filename = f"d{DAY}_input.txt") -> PuzzleAnswer:
     intervals = read_input(input_filename)
     merged = merge_intervals(intervals)
@@ -81,12 +163,43 @@ def run_tests() -> None:
     ]
 
     for input_filename, expected_answer in test_pairs:
+        if is_verified(__file__, input_filename, expected_answer):
+            continue
+
         solution_answer = solve(input_filename)
         assert solution_answer == expected_answer, (
             f"Test for intput {input_filename} failed.\n"
             f"Expected: {expected_answer}.\n"
             f"Got:      {solution_answer}."
         )
+        record_verified(__file__, input_filename, expected_answer)
+
+    for input_filename, expected_answer in test_pairs:
+        if is_verified(__file__, input_filename, expected_answer, "dynamic"):
+            continue
+
+        solution_answer = solve_dynamic(input_filename)
+        assert solution_answer == expected_answer, (
+            f"Dynamic test for intput {input_filename} failed.\n"
+            f"Expected: {expected_answer}.\n"
+            f"Got:      {solution_answer}."
+        )
+        record_verified(__file__, input_filename, expected_answer, "dynamic")
+
+    ranges, _ = parse_input(f"d{DAY}_test_01.txt")
+    interval_set = IntervalSet()
+    for low, high in ranges:
+        interval_set.add(low, high)
+    for low, high in ranges:
+        interval_set.remove(low, high)
+    assert interval_set.get_size() == 0 and len(interval_set.lows) == 0
+
+    input_filename = f"d{DAY}_test_01.txt"
+    p01_module = load_module(Path(__file__).with_name(f"d{DAY}p01.py"))
+    assert shares_cache_entries(p01_module.parse_input, parse_input, input_filename), (
+        f"Parse cache test for intput {input_filename} failed.\n"
+        f"Part 1 and part 2 stored separate entries."
+    )
 
 
 def main() -> None:
@@ -96,11 +209,13 @@ def main() -> None:
 
     parser = argparse.ArgumentParser()
     parser.add_argument("filename", nargs="?", help="puzzle input file")
+    add_profile_arguments(parser)
     args = parser.parse_args()
 
     if args.filename:
         print(f"Solving the puzzle with input {args.filename}...")
-        answer = solve(args.filename)
+        answer = run_with_profile(args.profile, solve, args.filename,
+                                  report_path=args.profile_output)
         print(f"Answer: {answer}")
 
 
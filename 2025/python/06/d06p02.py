@@ -1,59 +1,48 @@
 import argparse
-from collections import deque
+import re
 from math import prod
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from aoc.parsing import read_bytes, transpose_lines
+from aoc.verify import is_verified, record_verified
+from aoc.profiling import add_profile_arguments, run_with_profile
 
 DAY = "06"
 
 PuzzleAnswer = int
 Filename = str
 
-
-def get_last_line(filename: str) -> str:
-    with open(filename, "r", encoding="utf-8") as f:
-        return deque(f, maxlen=1)[0]
+OPERATOR_PATTERN = re.compile(rb"[^ ]")
 
 
 def read_input(input_filename: str) -> tuple[list[str], list[list[int]]]:
-    operators_line = get_last_line(input_filename)
+    lines = read_bytes(input_filename).split(b"\n")
+    if len(lines) > 1 and lines[-1] == b"":
+        lines.pop()
 
-    operators: list[str] = []
-    operand_columns: list[list[int]] = []
+    operators_line = lines[-1]
+    operand_lines = lines[:-1]
 
-    # Load the operators and precompute the counts of expected operands
-    # in each column
-    column_width = 0
-    for ch in operators_line:
-        if ch == " ":
-            column_width += 1
-        else:
-            operators.append(ch)
-            if column_width > 0:
-                operand_columns.append([0] * column_width)
-                column_width = 0
-    # This is always true for the last operator column in a valid input file
-    # if len(operand_columns) < len(operators):
-    operand_columns.append([0] * (column_width + 1))
-
-    # Load the operands for each column
-    with open(input_filename, "r", encoding="utf-8") as f:
-        for line in f:
-            col_idx = 0
-            subcol_idx = 0
-            for ch in line:
-                if ch in operators:
-                    break
-
-                if subcol_idx == len(operand_columns[col_idx]):
-                    col_idx += 1
-                    subcol_idx = 0
-                else:
-                    if ch != " ":
-                        digit = int(ch)
-
-                        operand_columns[col_idx][subcol_idx] = \
-                            (operand_columns[col_idx][subcol_idx] * 10) + digit
-
-                    subcol_idx += 1
+    # Every operator starts a column, which ends one character before the
+    # next operator (or at the end of the operators line for the last one)
+    operator_positions = [match.start()
+                          for match in OPERATOR_PATTERN.finditer(operators_line)]
+    operators = [operators_line[pos:pos + 1].decode() for pos in operator_positions]
+    column_ends = [pos - 1 for pos in operator_positions[1:]] + [len(operators_line)]
+
+    # Each character column, read top to bottom, holds the digits of one operand
+    char_columns = transpose_lines(operand_lines)
+
+    operand_columns: list[list[int]] = []
+    for column_start, column_end in zip(operator_positions, column_ends):
+        operands: list[int] = []
+        for x in range(column_start, column_end):
+            digits = char_columns[x].translate(None, b" ") if x < len(char_columns) else b""
+            operands.append(int(digits) if digits else 0)
+        operand_columns.append(operands)
 
     return operators, operand_columns
 
@@ -81,12 +70,16 @@ def run_tests() -> None:
     ]
 
     for input_filename, expected_answer in test_pairs:
+        if is_verified(__file__, input_filename, expected_answer):
+            continue
+
         solution_answer = solve(input_filename)
         assert solution_answer == expected_answer, (
             f"Test for intput {input_filename} failed.\n"
             f"Expected: {expected_answer}.\n"
             f"Got:      {solution_answer}."
         )
+        record_verified(__file__, input_filename, expected_answer)
 
 
 def main() -> None:
@@ -96,11 +89,13 @@ def main() -> None:
 
     parser = argparse.ArgumentParser()
     parser.add_argument("filename", nargs="?", help="puzzle input file")
+    add_profile_arguments(parser)
     args = parser.parse_args()
 
     if args.filename:
         print(f"Solving the puzzle with input {args.filename}...")
-        answer = solve(args.filename)
+        answer = run_with_profile(args.profile, solve, args.filename,
+                                  report_path=args.profile_output)
         print(f"Answer: {answer}")
 
 
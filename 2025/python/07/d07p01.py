@@ -1,4 +1,13 @@
 import argparse
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from aoc.cache import cached_parser
+from aoc.parsing import find_char_positions, read_bytes
+from aoc.verify import is_verified, record_verified
+from aoc.profiling import add_profile_arguments, run_with_profile
 
 DAY = "07"
 
@@ -20,19 +29,29 @@ class ManifoldDiagram:
         return 0 <= x < self.width and 0 <= y <= self.height
 
 
-def read_input(input_filename: str) -> ManifoldDiagram:
-    diagram = ManifoldDiagram()
+@cached_parser(f"d{DAY}")
+def parse_input(input_filename: str) -> tuple[set[Position], Position, int, int]:
+    data = read_bytes(input_filename)
+    lines = data.splitlines(keepends=True)
+
+    splitter_xs, splitter_ys = find_char_positions(data, b"^")
+    splitters: set[Position] = set(zip(splitter_xs, splitter_ys))
+
+    start: Position = (0, 0)
+    start_xs, start_ys = find_char_positions(data, b"S")
+    if len(start_xs) > 0:
+        start = (start_xs[-1], start_ys[-1])
 
-    with open(input_filename, "r", encoding="utf-8") as f:
-        for y, line in enumerate(f):
-            diagram.height += 1
-            diagram.width = max(diagram.width, len(line))
+    width = max((len(line) for line in lines), default=0)
+    height = len(lines)
 
-            for x, ch in enumerate(line):
-                if ch == "^":
-                    diagram.splitters.add((x, y))
-                elif ch == "S":
-                    diagram.start = (x, y)
+    return splitters, start, width, height
+
+
+def read_input(input_filename: str) -> ManifoldDiagram:
+    diagram = ManifoldDiagram()
+    diagram.splitters, diagram.start, diagram.width, diagram.height = \
+        parse_input(input_filename)
 
     return diagram
 
@@ -76,12 +95,16 @@ def run_tests() -> None:
     ]
 
     for input_filename, expected_answer in test_pairs:
+        if is_verified(__file__, input_filename, expected_answer):
+            continue
+
         solution_answer = solve(input_filename)
         assert solution_answer == expected_answer, (
             f"Test for intput {input_filename} failed.\n"
             f"Expected: {expected_answer}.\n"
             f"Got:      {solution_answer}."
         )
+        record_verified(__file__, input_filename, expected_answer)
 
 
 def main() -> None:
@@ -91,11 +114,13 @@ def main() -> None:
 
     parser = argparse.ArgumentParser()
     parser.add_argument("filename", nargs="?", help="puzzle input file")
+    add_profile_arguments(parser)
     args = parser.parse_args()
 
     if args.filename:
         print(f"Solving the puzzle with input {args.filename}...")
-        answer = solve(args.filename)
+        answer = run_with_profile(args.profile, solve, args.filename,
+                                  report_path=args.profile_output)
         print(f"Answer: {answer}")
 
 
@@ -1,6 +1,16 @@
 import argparse
 import heapq
 from math import prod
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from aoc.cache import cached_parser
+from aoc.parsing import read_bytes, read_ints
+from aoc.verify import is_verified, record_verified
+from aoc.profiling import add_profile_arguments, run_with_profile
+from aoc.phases import count, phase
 
 DAY = "08"
 
@@ -13,15 +23,11 @@ Vertex = Position
 Edge = tuple[int, int, int]
 
 
+@cached_parser(f"d{DAY}")
 def read_input(input_filename: str) -> list[Position]:
-    positions: list[Position] = []
-
-    with open(input_filename, "r", encoding="utf-8") as f:
-        for line in f:
-            x, y, z = map(int, line.split(","))
-            positions.append((x, y, z))
+    coords = read_ints(read_bytes(input_filename))
 
-    return positions
+    return list(zip(coords[0::3], coords[1::3], coords[2::3]))
 
 
 def euclidean_distance_squared(v1: Position, v2: Position) -> int:
@@ -55,9 +61,15 @@ def get_weighted_edges(vertices: list[Vertex], limit: int) -> list[Edge]:
 
 def solve(input_filename: Filename = f"d{DAY}_input.txt",
           connection_limit: int = 1000) -> PuzzleAnswer:
-    box_positions = read_input(input_filename)
-    connections = get_weighted_edges(box_positions, connection_limit)
-    connections.sort()
+    with phase("parse"):
+        box_positions = read_input(input_filename)
+
+    with phase("build"):
+        connections = get_weighted_edges(box_positions, connection_limit)
+    count("edges_generated", len(box_positions) * (len(box_positions) - 1) // 2)
+
+    with phase("sort"):
+        connections.sort()
 
     uf_parents = list(range(len(box_positions)))
     uf_sizes = [1] * len(box_positions)
@@ -82,16 +94,18 @@ def solve(input_filename: Filename = f"d{DAY}_input.txt",
         uf_parents[y_root] = x_root
         uf_sizes[x_root] += uf_sizes[y_root]
 
-    for i in range(min(connection_limit, len(connections))):
-        _, v1_idx, v2_idx = connections[i]
-        union(v1_idx, v2_idx)
+    with phase("search"):
+        for i in range(min(connection_limit, len(connections))):
+            _, v1_idx, v2_idx = connections[i]
+            union(v1_idx, v2_idx)
 
-    circuit_sizes: list[int] = []
-    for i in range(len(box_positions)):
-        if i == find(i):
-            circuit_sizes.append(uf_sizes[i])
+    with phase("reduce"):
+        circuit_sizes: list[int] = []
+        for i in range(len(box_positions)):
+            if i == find(i):
+                circuit_sizes.append(uf_sizes[i])
 
-    return prod(heapq.nlargest(3, circuit_sizes))
+        return prod(heapq.nlargest(3, circuit_sizes))
 
 
 def run_tests() -> None:
@@ -102,12 +116,16 @@ def run_tests() -> None:
 
     for parameters, expected_answer in test_pairs:
         input_filename, connection_limit = parameters
+        if is_verified(__file__, input_filename, expected_answer, parameters):
+            continue
+
         solution_answer = solve(input_filename, connection_limit)
         assert solution_answer == expected_answer, (
             f"Test for intput {input_filename} failed.\n"
             f"Expected: {expected_answer}.\n"
             f"Got:      {solution_answer}."
         )
+        record_verified(__file__, input_filename, expected_answer, parameters)
 
 
 def main() -> None:
@@ -117,11 +135,13 @@ def main() -> None:
 
     parser = argparse.ArgumentParser()
     parser.add_argument("filename", nargs="?", help="puzzle input file")
+    add_profile_arguments(parser)
     args = parser.parse_args()
 
     if args.filename:
         print(f"Solving the puzzle with input {args.filename}...")
-        answer = solve(args.filename)
+        answer = run_with_profile(args.profile, solve, args.filename,
+                                  report_path=args.profile_output)
         print(f"Answer: {answer}")
 
 
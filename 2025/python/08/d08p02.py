@@ -1,5 +1,16 @@
 import argparse
 import heapq
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from aoc.cache import cached_parser, shares_cache_entries
+from aoc.parsing import read_bytes, read_ints
+from aoc.verify import is_verified, record_verified
+from aoc.profiling import add_profile_arguments, run_with_profile
+from aoc.runner import load_module
+from aoc.phases import count, phase
 
 DAY = "08"
 
@@ -12,15 +23,11 @@ Vertex = Position
 Edge = tuple[int, int, int]
 
 
+@cached_parser(f"d{DAY}")
 def read_input(input_filename: str) -> list[Position]:
-    positions: list[Position] = []
+    coords = read_ints(read_bytes(input_filename))
 
-    with open(input_filename, "r", encoding="utf-8") as f:
-        for line in f:
-            x, y, z = map(int, line.split(","))
-            positions.append((x, y, z))
-
-    return positions
+    return list(zip(coords[0::3], coords[1::3], coords[2::3]))
 
 
 def euclidean_distance_squared(v1: Position, v2: Position) -> int:
@@ -60,10 +67,15 @@ def get_weighted_edges(vertices: list[Vertex],
 
 
 def solve(input_filename: Filename = f"d{DAY}_input.txt") -> PuzzleAnswer:
-    box_positions = read_input(input_filename)
+    with phase("parse"):
+        box_positions = read_input(input_filename)
+
+    with phase("build"):
+        connections = get_weighted_edges(box_positions)
+    count("edges_generated", len(connections))
 
-    connections = get_weighted_edges(box_positions)
-    connections.sort()
+    with phase("sort"):
+        connections.sort()
 
     uf_parents = list(range(len(box_positions)))
     uf_sizes = [1] * len(box_positions)
@@ -93,13 +105,16 @@ def solve(input_filename: Filename = f"d{DAY}_input.txt") -> PuzzleAnswer:
         uf_components -= 1
         return True
 
-    for _, v1_idx, v2_idx in connections:
-        merged = union(v1_idx, v2_idx)
+    with phase("search"):
+        for edges_scanned, (_, v1_idx, v2_idx) in enumerate(connections, 1):
+            merged = union(v1_idx, v2_idx)
 
-        if merged and uf_components == 1:
-            x1, _, _ = box_positions[v1_idx]
-            x2, _, _ = box_positions[v2_idx]
-            return x1 * x2
+            if merged and uf_components == 1:
+                count("edges_scanned", edges_scanned)
+
+                x1, _, _ = box_positions[v1_idx]
+                x2, _, _ = box_positions[v2_idx]
+                return x1 * x2
 
     assert False
 
@@ -112,12 +127,23 @@ def run_tests() -> None:
 
     for parameters, expected_answer in test_pairs:
         input_filename = parameters
+        if is_verified(__file__, input_filename, expected_answer):
+            continue
+
         solution_answer = solve(input_filename)
         assert solution_answer == expected_answer, (
             f"Test for intput {input_filename} failed.\n"
             f"Expected: {expected_answer}.\n"
             f"Got:      {solution_answer}."
         )
+        record_verified(__file__, input_filename, expected_answer)
+
+    input_filename = f"d{DAY}_test_01.txt"
+    p01_module = load_module(Path(__file__).with_name(f"d{DAY}p01.py"))
+    assert shares_cache_entries(p01_module.read_input, read_input, input_filename), (
+        f"Parse cache test for intput {input_filename} failed.\n"
+        f"Part 1 and part 2 stored separate entries."
+    )
 
 
 def main() -> None:
@@ -127,11 +153,13 @@ def main() -> None:
 
     parser = argparse.ArgumentParser()
     parser.add_argument("filename", nargs="?", help="puzzle input file")
+    add_profile_arguments(parser)
     args = parser.parse_args()
 
     if args.filename:
         print(f"Solving the puzzle with input {args.filename}...")
-        answer = solve(args.filename)
+        answer = run_with_profile(args.profile, solve, args.filename,
+                                  report_path=args.profile_output)
         print(f"Answer: {answer}")
 
 
@@ -1,5 +1,14 @@
 import argparse
 import itertools
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from aoc.cache import cached_parser
+from aoc.parsing import read_bytes, read_ints
+from aoc.verify import is_verified, record_verified
+from aoc.profiling import add_profile_arguments, run_with_profile
 
 DAY = "09"
 
@@ -9,16 +18,11 @@ PuzzleParams = Filename
 
 Position = tuple[int, int]
 
+@cached_parser(f"d{DAY}")
 def read_input(input_filename: str) -> list[Position]:
-    red_tiles: list[Position] = []
-
-    with open(input_filename, "r", encoding="utf-8") as f:
-        for line in f:
-            x, y = map(int, line.split(","))
+    coords = read_ints(read_bytes(input_filename))
 
-            red_tiles.append((x, y))
-
-    return red_tiles
+    return list(zip(coords[0::2], coords[1::2]))
 
 
 def solve(input_filename: Filename = f"d{DAY}_input.txt") -> PuzzleAnswer:
@@ -78,12 +82,16 @@ def run_tests() -> None:
 
     for parameters, expected_answer in test_pairs:
         input_filename = parameters
+        if is_verified(__file__, input_filename, expected_answer):
+            continue
+
         solution_answer = solve(input_filename)
         assert solution_answer == expected_answer, (
             f"Test for intput {input_filename} failed.\n"
             f"Expected: {expected_answer}.\n"
             f"Got:      {solution_answer}."
         )
+        record_verified(__file__, input_filename, expected_answer)
 
 
 def main() -> None:
@@ -93,11 +101,13 @@ def main() -> None:
 
     parser = argparse.ArgumentParser()
     parser.add_argument("filename", nargs="?", help="puzzle input file")
+    add_profile_arguments(parser)
     args = parser.parse_args()
 
     if args.filename:
         print(f"Solving the puzzle with input {args.filename}...")
-        answer = solve(args.filename)
+        answer = run_with_profile(args.profile, solve, args.filename,
+                                  report_path=args.profile_output)
         print(f"Answer: {answer}")
 
 
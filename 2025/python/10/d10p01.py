@@ -1,6 +1,14 @@
 import argparse
-from typing import Generator
 import re
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from aoc.cache import cached_parser
+from aoc.verify import is_verified, record_verified
+from aoc.profiling import add_profile_arguments, run_with_profile
+from aoc.phases import count, phase
 
 DAY = "10"
 
@@ -8,9 +16,12 @@ PuzzleAnswer = int
 Filename = str
 PuzzleParams = Filename
 
+Machine = tuple[str, list[list[int]], list[int]]
+
 INFINITY = 10 ** 20
 
-def read_input(input_filename: Filename) -> Generator[tuple[str, list[list[int]], list[int]]]:
+@cached_parser(f"d{DAY}")
+def read_input(input_filename: Filename) -> list[Machine]:
     # Pattern splitting input like
     #   «[.##.] (3) (1,3) (2) {3,5,4,7}»
     # into three groups:
@@ -22,12 +33,16 @@ def read_input(input_filename: Filename) -> Generator[tuple[str, list[list[int]]
     #   «3», «1, 3», «2».
     button_pattern = re.compile(r"\((.*?)\)")
 
+    machines: list[Machine] = []
+
     with open(input_filename, "r", encoding="utf-8") as f:
         for line in f:
             line = line.strip()
 
             triple_match = line_pattern.match(line)
 
+            assert triple_match is not None
+
             target = triple_match.group(1).strip()
 
             buttons_str = triple_match.group(2).strip()
@@ -43,17 +58,21 @@ def read_input(input_filename: Filename) -> Generator[tuple[str, list[list[int]]
                         for j in joltages_str.split(',')
                         if j.strip() != ""]
 
-            yield target, buttons, joltages
+            machines.append((target, buttons, joltages))
+
+    return machines
 
 
 def minimum_presses(target: str, buttons: list[int]) -> int:
     min_presses = INFINITY
     start = "." * len(target)
 
+    result_presses: dict[str, int] = {}
     min_presses = min_presses_rec(target, start,
                                   buttons,
                                   min_presses, 0,
-                                  {})
+                                  result_presses)
+    count("search_states", len(result_presses))
 
     return min_presses
 
@@ -89,8 +108,12 @@ def min_presses_rec(target: str, current: str,
 def solve(input_filename: Filename = f"d{DAY}_input.txt") -> PuzzleAnswer:
     total_min_presses = 0
 
-    for target, buttons, _ in read_input(input_filename):
-        total_min_presses += minimum_presses(target, buttons)
+    with phase("parse"):
+        machines = read_input(input_filename)
+
+    with phase("search"):
+        for target, buttons, _ in machines:
+            total_min_presses += minimum_presses(target, buttons)
 
     return total_min_presses
 
@@ -102,12 +125,16 @@ def run_tests() -> None:
 
     for parameters, expected_answer in test_pairs:
         input_filename = parameters
+        if is_verified(__file__, input_filename, expected_answer):
+            continue
+
         solution_answer = solve(input_filename)
         assert solution_answer == expected_answer, (
             f"Test for intput {input_filename} failed.\n"
             f"Expected: {expected_answer}.\n"
             f"Got:      {solution_answer}."
         )
+        record_verified(__file__, input_filename, expected_answer)
 
 
 def main() -> None:
@@ -117,11 +144,13 @@ def main() -> None:
 
     parser = argparse.ArgumentParser()
     parser.add_argument("filename", nargs="?", help="puzzle input file")
+    add_profile_arguments(parser)
     args = parser.parse_args()
 
     if args.filename:
         print(f"Solving the puzzle with input {args.filename}...")
-        answer = solve(args.filename)
+        answer = run_with_profile(args.profile, solve, args.filename,
+                                  report_path=args.profile_output)
         print(f"Answer: {answer}")
 
 
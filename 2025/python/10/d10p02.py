@@ -1,8 +1,18 @@
-from typing import Generator, NamedTuple
+from typing import NamedTuple
 import argparse
 import re
 from fractions import Fraction
 import math
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from aoc.cache import cached_parser, shares_cache_entries
+from aoc.verify import is_verified, record_verified
+from aoc.profiling import add_profile_arguments, run_with_profile
+from aoc.runner import load_module
+from aoc.phases import count, phase
 
 
 DAY = "10"
@@ -11,6 +21,8 @@ PuzzleAnswer = int
 Filename = str
 PuzzleParams = Filename
 
+Machine = tuple[str, list[list[int]], list[int]]
+
 
 class LinearSystemResult(NamedTuple):
     aug_matrix: list[list[Fraction]]
@@ -19,7 +31,8 @@ class LinearSystemResult(NamedTuple):
     is_consistent: bool
 
 
-def read_input(input_filename: Filename) -> Generator[tuple[str, list[list[int]], list[int]]]:
+@cached_parser(f"d{DAY}")
+def read_input(input_filename: Filename) -> list[Machine]:
     # Pattern splitting input like
     #   «[.##.] (3) (1,3) (2) {3,5,4,7}»
     # into three groups:
@@ -31,6 +44,8 @@ def read_input(input_filename: Filename) -> Generator[tuple[str, list[list[int]]
     #   «3», «1, 3», «2».
     button_pattern = re.compile(r"\((.*?)\)")
 
+    machines: list[Machine] = []
+
     with open(input_filename, "r", encoding="utf-8") as f:
         for line in f:
             line = line.strip()
@@ -54,7 +69,9 @@ def read_input(input_filename: Filename) -> Generator[tuple[str, list[list[int]]
                         for j in joltages_str.split(',')
                         if j.strip() != ""]
 
-            yield target, buttons, joltages
+            machines.append((target, buttons, joltages))
+
+    return machines
 
 
 def solve_linear_system(matrix: list[list[int]], target: list[int]) -> LinearSystemResult:
@@ -135,9 +152,12 @@ def find_min_int_solution(system: LinearSystemResult, free_bounds: list[int]) ->
         constraints.append((aug_mat[row_i][-1], coeffs))
 
     min_total = float("inf")
+    nodes_expanded = 0
 
     def search(idx: int, current_cost: Fraction, current_vals: list[int]) -> None:
-        nonlocal min_total
+        nonlocal min_total, nodes_expanded
+
+        nodes_expanded += 1
 
         # No free variables left
         if idx == len(free_cols):
@@ -204,6 +224,7 @@ def find_min_int_solution(system: LinearSystemResult, free_bounds: list[int]) ->
             current_vals.pop()
 
     search(0, base_cost, [])
+    count("search_nodes_expanded", nodes_expanded)
 
     return int(min_total) if min_total != float("inf") else 0
 
@@ -216,7 +237,8 @@ def minimum_presses(target: list[int], buttons: list[list[int]]) -> int:
         for row_idx in button:
             buttons_matrix[row_idx][col_idx] = 1
 
-    system_solution = solve_linear_system(buttons_matrix, target)
+    with phase("build"):
+        system_solution = solve_linear_system(buttons_matrix, target)
     if not system_solution.is_consistent:
         return 0
 
@@ -229,13 +251,17 @@ def minimum_presses(target: list[int], buttons: list[list[int]]) -> int:
             limit = min(target[i] for i in affected_indices)
             free_variable_bounds.append(limit)
 
-    return find_min_int_solution(system_solution, free_variable_bounds)
+    with phase("search"):
+        return find_min_int_solution(system_solution, free_variable_bounds)
 
 
 def solve(input_filename: Filename = f"d{DAY}_input.txt") -> PuzzleAnswer:
     total_min_presses = 0
 
-    for _, buttons, target in read_input(input_filename):
+    with phase("parse"):
+        machines = read_input(input_filename)
+
+    for _, buttons, target in machines:
         total_min_presses += minimum_presses(target, buttons)
 
     return total_min_presses
@@ -249,12 +275,23 @@ def run_tests() -> None:
 
     for parameters, expected_answer in test_pairs:
         input_filename = parameters
+        if is_verified(__file__, input_filename, expected_answer):
+            continue
+
         solution_answer = solve(input_filename)
         assert solution_answer == expected_answer, (
             f"Test for intput {input_filename} failed.\n"
             f"Expected: {expected_answer}.\n"
             f"Got:      {solution_answer}."
         )
+        record_verified(__file__, input_filename, expected_answer)
+
+    input_filename = f"d{DAY}_test_01.txt"
+    p01_module = load_module(Path(__file__).with_name(f"d{DAY}p01.py"))
+    assert shares_cache_entries(p01_module.read_input, read_input, input_filename), (
+        f"Parse cache test for intput {input_filename} failed.\n"
+        f"Part 1 and part 2 stored separate entries."
+    )
 
 
 def main() -> None:
@@ -264,11 +301,13 @@ def main() -> None:
 
     parser = argparse.ArgumentParser()
     parser.add_argument("filename", nargs="?", help="puzzle input file")
+    add_profile_arguments(parser)
     args = parser.parse_args()
 
     if args.filename:
         print(f"Solving the puzzle with input {args.filename}...")
-        answer = solve(args.filename)
+        answer = run_with_profile(args.profile, solve, args.filename,
+                                  report_path=args.profile_output)
         print(f"Answer: {answer}")
 
 
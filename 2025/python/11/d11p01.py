@@ -1,4 +1,12 @@
 import argparse
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from aoc.cache import cached_parser
+from aoc.verify import is_verified, record_verified
+from aoc.profiling import add_profile_arguments, run_with_profile
 
 DAY = "11"
 
@@ -21,24 +29,38 @@ class GraphNode:
 Graph = dict[str, GraphNode]
 
 
-def read_input(input_filename: Filename) -> Graph:
-    graph: dict[str, GraphNode] = {}
+@cached_parser(f"d{DAY}")
+def parse_input(input_filename: Filename) -> dict[str, list[str]]:
+    adjacency: dict[str, list[str]] = {}
 
     with open(input_filename, "r", encoding="utf-8") as f:
         for line in f:
             from_node_name, to_node_names = line.split(":")
-            to_node_names = to_node_names.strip().split(" ")
+            to_node_names = to_node_names.strip().split()
 
-            if from_node_name not in graph:
-                graph[from_node_name] = GraphNode(from_node_name)
-            pred_node = graph[from_node_name]
+            if from_node_name not in adjacency:
+                adjacency[from_node_name] = []
 
             for to_node_name in to_node_names:
-                if to_node_name not in graph:
-                    graph[to_node_name] = GraphNode(to_node_name)
-                succ_node = graph[to_node_name]
+                adjacency[from_node_name].append(to_node_name)
+
+    return adjacency
+
 
-                pred_node.succs.append(succ_node)
+def read_input(input_filename: Filename) -> Graph:
+    graph: dict[str, GraphNode] = {}
+
+    for from_node_name, to_node_names in parse_input(input_filename).items():
+        if from_node_name not in graph:
+            graph[from_node_name] = GraphNode(from_node_name)
+        pred_node = graph[from_node_name]
+
+        for to_node_name in to_node_names:
+            if to_node_name not in graph:
+                graph[to_node_name] = GraphNode(to_node_name)
+            succ_node = graph[to_node_name]
+
+            pred_node.succs.append(succ_node)
 
     return graph
 
@@ -78,12 +100,16 @@ def run_tests() -> None:
 
     for parameters, expected_answer in test_pairs:
         input_filename = parameters
+        if is_verified(__file__, input_filename, expected_answer):
+            continue
+
         solution_answer = solve(input_filename)
         assert solution_answer == expected_answer, (
             f"Test for intput {input_filename} failed.\n"
             f"Expected: {expected_answer}.\n"
             f"Got:      {solution_answer}."
         )
+        record_verified(__file__, input_filename, expected_answer)
 
 
 def main() -> None:
@@ -93,11 +119,13 @@ def main() -> None:
 
     parser = argparse.ArgumentParser()
     parser.add_argument("filename", nargs="?", help="puzzle input file")
+    add_profile_arguments(parser)
     args = parser.parse_args()
 
     if args.filename:
         print(f"Solving the puzzle with input {args.filename}...")
-        answer = solve(args.filename)
+        answer = run_with_profile(args.profile, solve, args.filename,
+                                  report_path=args.profile_output)
         print(f"Answer: {answer}")
 
 
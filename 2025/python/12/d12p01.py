@@ -1,4 +1,13 @@
 import argparse
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from aoc.cache import cached_parser
+from aoc.verify import is_verified, record_verified
+from aoc.profiling import add_profile_arguments, run_with_profile
+from aoc.phases import count, phase
 
 DAY = "12"
 
@@ -97,6 +106,9 @@ class DancingLinksMatrix:
 
         self.root: HeaderNode = HeaderNode("root")
 
+        self.row_count = 0
+        self.nodes_visited = 0
+
         self.shape_headers: list[HeaderNode] = []
         for shape_i, shape_count in enumerate(area.shape_counts):
             for count_i in range(shape_count):
@@ -119,6 +131,8 @@ class DancingLinksMatrix:
             self.area_headers.append(row)
 
     def add_row(self, headers: list[HeaderNode]) -> None:
+        self.row_count += 1
+
         first_node: Node | None = None
         last_node: Node | None = None
 
@@ -210,6 +224,8 @@ class DancingLinksMatrix:
 
 
     def search(self) -> bool:
+        self.nodes_visited += 1
+
         if self.root.right == self.root:
             return True
 
@@ -247,15 +263,16 @@ class DancingLinksMatrix:
         return False
 
 
-def read_input(input_filename: Filename) -> tuple[list[Shape], list[Area]]:
+@cached_parser(f"d{DAY}")
+def parse_input(input_filename: Filename) -> tuple[list[list[str]], list[tuple[int, int, list[int]]]]:
     shape_lines: list[str] = []
-    shapes: list[Shape] = []
-    areas: list[Area] = []
+    shapes_lines: list[list[str]] = []
+    areas: list[tuple[int, int, list[int]]] = []
 
     def flush_shape():
         nonlocal shape_lines
         if shape_lines:
-            shapes.append(Shape(shape_lines))
+            shapes_lines.append(shape_lines)
             shape_lines = []
 
     with open(input_filename, "r") as input_file:
@@ -273,8 +290,7 @@ def read_input(input_filename: Filename) -> tuple[list[Shape], list[Area]]:
                 area_width, area_height = map(int, area_size_str.split("x"))
                 shape_counts = list(map(int, shape_counts_str.strip().split()))
 
-                area = Area(area_width, area_height, shape_counts)
-                areas.append(area)
+                areas.append((area_width, area_height, shape_counts))
             elif line.endswith(":") and line[:-1].isdigit():
                 flush_shape()
             elif line[0] == "#" or line[0] == ".":
@@ -282,12 +298,23 @@ def read_input(input_filename: Filename) -> tuple[list[Shape], list[Area]]:
 
     flush_shape() # Catch the final shape if file ends with one
 
+    return shapes_lines, areas
+
+
+def read_input(input_filename: Filename) -> tuple[list[Shape], list[Area]]:
+    shapes_lines, area_params = parse_input(input_filename)
+
+    shapes = [Shape(shape_lines) for shape_lines in shapes_lines]
+    areas = [Area(width, height, shape_counts)
+             for width, height, shape_counts in area_params]
+
     return shapes, areas
 
 
 
 def solve(input_filename: Filename = f"d{DAY}_input.txt") -> PuzzleAnswer:
-    shapes, areas = read_input(input_filename)
+    with phase("parse"):
+        shapes, areas = read_input(input_filename)
 
     fitting_area_count = 0
 
@@ -302,10 +329,17 @@ def solve(input_filename: Filename = f"d{DAY}_input.txt") -> PuzzleAnswer:
             print(f"Area {area.width}x{area.height} with shape counts {area.shape_counts} trivially fits.")
             fitting_area_count += 1
         elif area_cells >= total_shape_cells:
-            dl_matrix = DancingLinksMatrix(shapes, area)
-            dl_matrix.generate_rows()
+            with phase("build"):
+                dl_matrix = DancingLinksMatrix(shapes, area)
+                dl_matrix.generate_rows()
 
-            if dl_matrix.search():
+            with phase("search"):
+                fits = dl_matrix.search()
+
+            count("dlx_rows", dl_matrix.row_count)
+            count("dlx_nodes_visited", dl_matrix.nodes_visited)
+
+            if fits:
                 print(f"Area {area.width}x{area.height} with shape counts {area.shape_counts} fits.")
                 fitting_area_count += 1
 
@@ -322,12 +356,16 @@ def run_tests() -> None:
 
     for parameters, expected_answer in test_pairs:
         input_filename = parameters
+        if is_verified(__file__, input_filename, expected_answer):
+            continue
+
         solution_answer = solve(input_filename)
         assert solution_answer == expected_answer, (
             f"Test for intput {input_filename} failed.\n"
             f"Expected: {expected_answer}.\n"
             f"Got:      {solution_answer}."
         )
+        record_verified(__file__, input_filename, expected_answer)
 
 
 def main() -> None:
@@ -337,11 +375,13 @@ def main() -> None:
 
     parser = argparse.ArgumentParser()
     parser.add_argument("filename", nargs="?", help="puzzle input file")
+    add_profile_arguments(parser)
     args = parser.parse_args()
 
     if args.filename:
         print(f"Solving the puzzle with input {args.filename}...")
-        answer = solve(args.filename)
+        answer = run_with_profile(args.profile, solve, args.filename,
+                                  report_path=args.profile_output)
         print(f"Answer: {answer}")
 
 
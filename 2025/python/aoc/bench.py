@@ -0,0 +1,189 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from aoc.generators import GENERATORS
+from aoc.runner import YEAR_DIR, SOLUTION_PATTERN, load_module, raise_recursion_limit
+
+DEFAULT_HISTORY = YEAR_DIR / "bench_history.json"
+
+BenchRecord = dict[str, Any]
+
+
+def get_commit() -> str | None:
+    try:
+        completed = subprocess.run(["git", "rev-parse", "--short", "HEAD"],
+                                   cwd=YEAR_DIR, capture_output=True,
+                                   text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    return completed.stdout.strip()
+
+
+def find_solution_modules(day: int) -> list[tuple[int, Path]]:
+    day_dir = YEAR_DIR / f"{day:02}"
+    modules: list[tuple[int, Path]] = []
+
+    for module_path in sorted(day_dir.glob(f"d{day:02}p*.py")):
+        match = SOLUTION_PATTERN.match(module_path.name)
+        if match is not None:
+            modules.append((int(match.group(2)), module_path))
+
+    return modules
+
+
+def bench_day(day: int, scales: list[float], seed: int,
+              repeat: int) -> list[BenchRecord]:
+    records: list[BenchRecord] = []
+    modules = [(part, load_module(path)) for part, path in find_solution_modules(day)]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for scale in scales:
+            input_text = GENERATORS[day](scale, random.Random(seed))
+            input_path = Path(tmp_dir) / f"d{day:02}_bench.txt"
+            input_path.write_text(input_text, encoding="utf-8")
+
+            for part, module in modules:
+                record: BenchRecord = {
+                    "day": day,
+                    "part": part,
+                    "scale": scale,
+                    "input_bytes": len(input_text),
+                }
+
+                try:
+                    wall_times: list[float] = []
+                    cpu_times: list[float] = []
+                    for _ in range(repeat):
+                        with contextlib.redirect_stdout(io.StringIO()):
+                            wall_start = time.perf_counter()
+                            cpu_start = time.process_time()
+                            answer = module.solve(str(input_path))
+                            cpu_times.append(time.process_time() - cpu_start)
+                            wall_times.append(time.perf_counter() - wall_start)
+
+                    record["answer"] = answer
+                    record["wall_time"] = min(wall_times)
+                    record["cpu_time"] = min(cpu_times)
+                except Exception as error:
+                    record["error"] = f"{type(error).__name__}: {error}"
+
+                records.append(record)
+                print_record(record)
+
+    return records
+
+
+def print_record(record: BenchRecord) -> None:
+    label = f"d{record['day']:02}p{record['part']:02} x{record['scale']:<6g}"
+    if "error" in record:
+        print(f"{label} {record['input_bytes']:>12} B  {record['error']}")
+    else:
+        print(f"{label} {record['input_bytes']:>12} B "
+              f"{record['wall_time']:>10.4f}s wall {record['cpu_time']:>10.4f}s CPU")
+
+
+def load_history(history_path: Path) -> list[dict[str, Any]]:
+    if not history_path.is_file():
+        return []
+
+    with open(history_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_history(history_path: Path, history: list[dict[str, Any]]) -> None:
+    with open(history_path, "w", encoding="utf-8") as f:
+        json.dump(history, f, indent=1)
+
+
+def report_regressions(previous_run: dict[str, Any], records: list[BenchRecord],
+                       threshold: float) -> None:
+    previous_times = {(r["day"], r["part"], r["scale"]): r["wall_time"]
+                      for r in previous_run["records"] if "wall_time" in r}
+
+    for record in records:
+        key = (record["day"], record["part"], record["scale"])
+        if "wall_time" not in record or key not in previous_times:
+            continue
+
+        ratio = record["wall_time"] / max(previous_times[key], 1e-9)
+        if ratio > threshold:
+            print(f"Regression: d{key[0]:02}p{key[1]:02} x{key[2]:g} is {ratio:.2f}x "
+                  f"slower than at commit {previous_run.get('commit')}")
+
+
+def ingest_profiles(history_path: Path, report_paths: list[Path]) -> None:
+    history = load_history(history_path)
+
+    for report_path in report_paths:
+        with open(report_path, "r", encoding="utf-8") as f:
+            report = json.load(f)
+
+        history.append({
+            "timestamp": report["timestamp"],
+            "commit": get_commit(),
+            "profile": report,
+        })
+        print(f"Ingested {report['mode']} profile of {report['source']}")
+
+    save_history(history_path, history)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="aoc.bench")
+    parser.add_argument("days", nargs="*", type=int,
+                        help="days to benchmark (all by default)")
+    parser.add_argument("--scales", nargs="+", type=float, default=[1.0],
+                        help="input sizes relative to the real puzzle input")
+    parser.add_argument("--seed", type=int, default=2025)
+    parser.add_argument("--repeat", type=int, default=1,
+                        help="runs per measurement, the fastest one is kept")
+    parser.add_argument("--history", type=Path, default=DEFAULT_HISTORY,
+                        help="JSON file the results are appended to")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="slowdown ratio reported as a regression")
+    parser.add_argument("--ingest", nargs="+", type=Path, default=None,
+                        help="add --profile reports to the history instead "
+                             "of benchmarking")
+    args = parser.parse_args()
+
+    if args.ingest:
+        ingest_profiles(args.history, args.ingest)
+        return
+
+    # Every repeat would otherwise load the parse cached by the first one,
+    # and reruns with the same seed would never time the parsers at all
+    os.environ["AOC_NO_CACHE"] = "1"
+    raise_recursion_limit()
+
+    days = args.days or sorted(GENERATORS)
+
+    records: list[BenchRecord] = []
+    for day in days:
+        records.extend(bench_day(day, args.scales, args.seed, args.repeat))
+
+    history = load_history(args.history)
+    previous_runs = [run for run in history if "records" in run]
+    if len(previous_runs) > 0:
+        report_regressions(previous_runs[-1], records, args.threshold)
+
+    history.append({
+        "timestamp": time.time(),
+        "commit": get_commit(),
+        "seed": args.seed,
+        "records": records,
+    })
+    save_history(args.history, history)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+import functools
+import hashlib
+import inspect
+import mmap
+import os
+import pickle
+from pathlib import Path
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+AOC_DIR = Path(__file__).resolve().parent
+
+YEAR_DIR = AOC_DIR.parent
+
+CACHE_DIR = Path(os.environ.get("AOC_CACHE_DIR", YEAR_DIR / ".aoc_cache"))
+
+PARSED_DIR = CACHE_DIR / "parsed"
+
+
+def is_cache_enabled() -> bool:
+    return os.environ.get("AOC_NO_CACHE", "") == ""
+
+
+def file_digest(filename: str | Path) -> str:
+    with open(filename, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def source_digest(source_filename: str) -> str:
+    # The solutions depend on the shared «aoc» modules as well, so a change
+    # to any of them counts as a change of the solution's source
+    digest = hashlib.sha256()
+
+    for path in [Path(source_filename), *sorted(AOC_DIR.glob("*.py"))]:
+        digest.update(path.name.encode())
+        digest.update(file_digest(path).encode())
+
+    return digest.hexdigest()
+
+
+def load_pickle(path: Path) -> object:
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return pickle.load(f)
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return pickle.loads(mm)
+
+
+def store_pickle(path: Path, value: object) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Write to a temporary file first so concurrent readers never see
+    # a partially written cache entry
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+
+def get_parser_digest(parser: Callable[[str], object]) -> str:
+    # Only the parser function itself and the shared parsing helpers, so the
+    # identical parsers of a day's two parts share their entries even though
+    # the rest of their modules differ
+    digest = hashlib.sha256(inspect.getsource(parser).encode())
+    digest.update(file_digest(AOC_DIR / "parsing.py").encode())
+
+    return digest.hexdigest()
+
+
+def cached_parser(name: str, version: int = 1) -> Callable[[Callable[[str], T]], Callable[[str], T]]:
+    # Entries are keyed by the parser's source (and the shared parsing
+    # helpers) besides the input, so editing a parser invalidates them on
+    # its own. Module-level constants the parser uses are not part of the
+    # key, so changing one of them needs a bump of the «version». The
+    # result must only consist of built-in types, since the solution
+    # modules are loaded under different names by different entry points.
+    # The «name» only makes the entries easier to tell apart.
+    def decorator(parser: Callable[[str], T]) -> Callable[[str], T]:
+        parser_digest = get_parser_digest(parser)
+
+        @functools.wraps(parser)
+        def wrapper(input_filename: str) -> T:
+            if not is_cache_enabled():
+                return parser(input_filename)
+
+            digest = hashlib.sha256(f"{parser_digest}\n{file_digest(input_filename)}".encode())
+            cache_path = PARSED_DIR / f"{name}-v{version}-{digest.hexdigest()}.pickle"
+
+            if cache_path.is_file():
+                try:
+                    return load_pickle(cache_path)  # type: ignore[return-value]
+                except (OSError, pickle.UnpicklingError, EOFError):
+                    pass
+
+            result = parser(input_filename)
+            store_pickle(cache_path, result)
+
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def shares_cache_entries(parser: Callable[[str], object], other_parser: Callable[[str], object],
+                         input_filename: str) -> bool:
+    # Whether «other_parser» reuses the entry «parser» stores for the input
+    # instead of storing its own, as the parsers of both parts of a day should
+    if not is_cache_enabled():
+        return True
+
+    parser(input_filename)
+    entries = set(PARSED_DIR.iterdir())
+    other_parser(input_filename)
+
+    return set(PARSED_DIR.iterdir()) == entries
@@ -0,0 +1,266 @@
+import math
+import random
+import string
+from typing import Callable
+
+# A scale of 1 produces an input roughly the size of the real puzzle input
+Generator = Callable[[float, random.Random], str]
+
+
+def scaled(base_count: int, scale: float) -> int:
+    return max(1, round(base_count * scale))
+
+
+def generate_d01(scale: float, rng: random.Random) -> str:
+    lines = [f"{rng.choice('LR')}{rng.randint(1, 999)}"
+             for _ in range(scaled(4671, scale))]
+
+    return "\n".join(lines) + "\n"
+
+
+def generate_d02(scale: float, rng: random.Random) -> str:
+    id_ranges: list[str] = []
+
+    for _ in range(scaled(40, scale)):
+        digit_count = rng.randint(2, 10)
+        start_id = rng.randint(10 ** (digit_count - 1), 10 ** digit_count - 1)
+        end_id = start_id + rng.randint(0, 200_000)
+        id_ranges.append(f"{start_id}-{end_id}")
+
+    return ",".join(id_ranges)
+
+
+def generate_d03(scale: float, rng: random.Random) -> str:
+    lines = ["".join(rng.choices("123456789", k=100))
+             for _ in range(scaled(200, scale))]
+
+    return "\n".join(lines) + "\n"
+
+
+def generate_d04(scale: float, rng: random.Random) -> str:
+    # Scale the area rather than the side of the grid
+    side = scaled(136, scale ** 0.5)
+    lines = ["".join("@" if rng.random() < 0.67 else "." for _ in range(side))
+             for _ in range(side)]
+
+    return "\n".join(lines) + "\n"
+
+
+def generate_d05(scale: float, rng: random.Random) -> str:
+    id_limit = 560_000_000_000_000
+
+    lines: list[str] = []
+    for _ in range(scaled(179, scale)):
+        low = rng.randint(1, id_limit)
+        high = low + rng.randint(0, 10_000_000_000_000)
+        lines.append(f"{low}-{high}")
+
+    lines.append("")
+
+    for _ in range(scaled(1000, scale)):
+        lines.append(str(rng.randint(1, id_limit)))
+
+    return "\n".join(lines) + "\n"
+
+
+def generate_d06(scale: float, rng: random.Random) -> str:
+    operand_row_count = 3
+    rows: list[list[str]] = [[] for _ in range(operand_row_count + 1)]
+
+    for _ in range(scaled(1000, scale)):
+        operands = [str(rng.randint(1, 9999)) for _ in range(operand_row_count)]
+        width = max(len(operand) for operand in operands)
+        align_left = rng.random() < 0.5
+
+        for row_idx, operand in enumerate(operands):
+            cell = operand.ljust(width) if align_left else operand.rjust(width)
+            rows[row_idx].append(cell)
+        rows[-1].append(rng.choice("+*").ljust(width))
+
+    # The solvers expect the operator row to be the last one, without
+    # a trailing newline
+    return "\n".join(" ".join(row) for row in rows)
+
+
+def generate_d07(scale: float, rng: random.Random) -> str:
+    # Splitters sit on every other row, inside the triangle the beams can reach
+    height = scaled(142, scale ** 0.5)
+    width = height - 1
+    start_x = width // 2
+
+    lines = ["." * start_x + "S" + "." * (width - start_x - 1)]
+    for y in range(1, height):
+        row = ["."] * width
+        if y % 2 == 0:
+            reach = y // 2
+            for x in range(max(0, start_x - reach), min(width, start_x + reach + 1), 2):
+                if rng.random() < 0.7:
+                    row[x] = "^"
+        lines.append("".join(row))
+
+    return "\n".join(lines) + "\n"
+
+
+def generate_d08(scale: float, rng: random.Random) -> str:
+    lines = [",".join(str(rng.randint(0, 99_999)) for _ in range(3))
+             for _ in range(scaled(1000, scale))]
+
+    return "\n".join(lines) + "\n"
+
+
+def generate_d09(scale: float, rng: random.Random) -> str:
+    # Walk around a circle in axis-aligned steps, which forms a simple
+    # rectilinear polygon like the real input
+    point_count = scaled(248, scale)
+    radius = 48_000
+
+    angles = sorted(rng.uniform(0, 2 * math.pi)
+                    for _ in range(point_count))
+    circle_points: list[tuple[int, int]] = []
+    for angle in angles:
+        x = 50_000 + round(radius * math.cos(angle))
+        y = 50_000 + round(radius * math.sin(angle))
+        if not circle_points or circle_points[-1] != (x, y):
+            circle_points.append((x, y))
+
+    vertices: list[tuple[int, int]] = []
+    for i, (x, y) in enumerate(circle_points):
+        next_x, _ = circle_points[(i + 1) % len(circle_points)]
+        vertices.append((x, y))
+        if next_x != x:
+            vertices.append((next_x, y))
+
+    return "\n".join(f"{x},{y}" for x, y in vertices) + "\n"
+
+
+def generate_d10(scale: float, rng: random.Random) -> str:
+    lines: list[str] = []
+
+    for _ in range(scaled(153, scale)):
+        # Like the real input, machines have about as many buttons as lights
+        # (-2 to +2, rarely +3) and each button wires up to all but one of
+        # the lights, so the joltage systems have at most a few free presses
+        light_count = rng.randint(4, 10)
+        button_count = max(2, light_count + rng.choices(range(-2, 4),
+                                                        weights=[6, 6, 6, 6, 6, 1])[0])
+
+        buttons = [sorted(rng.sample(range(light_count), rng.randint(1, light_count - 1)))
+                   for _ in range(button_count)]
+
+        lights = [False] * light_count
+        joltages = [0] * light_count
+        for button in buttons:
+            toggled = rng.random() < 0.5
+            presses = rng.randint(0, 30)
+            for idx in button:
+                lights[idx] ^= toggled
+                joltages[idx] += presses
+
+        lights_str = "".join("#" if light else "." for light in lights)
+        buttons_str = " ".join("(" + ",".join(map(str, button)) + ")"
+                               for button in buttons)
+        joltages_str = ",".join(map(str, joltages))
+        lines.append(f"[{lights_str}] {buttons_str} {{{joltages_str}}}")
+
+    return "\n".join(lines) + "\n"
+
+
+def generate_d11(scale: float, rng: random.Random) -> str:
+    # A layered DAG keeps the path length (and the solvers' recursion depth)
+    # independent of the graph size
+    layer_count = 20
+    node_count = scaled(574, scale)
+    layer_size = max(1, node_count // layer_count)
+
+    reserved = {"you", "out", "svr", "fft", "dac"}
+    name_length = 3
+    while 26 ** name_length < 2 * node_count:
+        name_length += 1
+    names: set[str] = set()
+    while len(names) < layer_size * layer_count:
+        name = "".join(rng.choices(string.ascii_lowercase, k=name_length))
+        if name not in reserved:
+            names.add(name)
+
+    name_list = sorted(names)
+    rng.shuffle(name_list)
+    layers = [name_list[i * layer_size:(i + 1) * layer_size]
+              for i in range(layer_count)]
+    layers[0][0] = "svr"
+    layers[1][0] = "you"
+    layers[layer_count // 3][0] = "fft"
+    layers[2 * layer_count // 3][0] = "dac"
+
+    succs: dict[str, set[str]] = {}
+    for layer_idx, layer in enumerate(layers):
+        for name in layer:
+            if layer_idx == layer_count - 1:
+                succs[name] = {"out"}
+            else:
+                next_layer = layers[layer_idx + 1]
+                succs[name] = set(rng.sample(next_layer, min(len(next_layer), rng.randint(1, 4))))
+
+    # Guarantee a «svr» -> «fft» -> «dac» -> «out» path and a «you» -> «out» path
+    for layer_idx in range(layer_count - 1):
+        succs[layers[layer_idx][0]].add(layers[layer_idx + 1][0])
+
+    return "\n".join(f"{name}: {' '.join(sorted(succ_names))}"
+                     for name, succ_names in succs.items()) + "\n"
+
+
+D12_SHAPES = [
+    ["#.#", "###", "#.#"],
+    ["###", ".##", "..#"],
+    [".##", "##.", "#.."],
+    ["###", "..#", "###"],
+    [".##", "###", "#.#"],
+    ["###", "###", "#.."],
+]
+
+
+def generate_d12(scale: float, rng: random.Random) -> str:
+    lines: list[str] = []
+    for shape_idx, shape in enumerate(D12_SHAPES):
+        lines.append(f"{shape_idx}:")
+        lines.extend(shape)
+        lines.append("")
+
+    shape_cells = ["".join(shape).count("#") for shape in D12_SHAPES]
+
+    for area_idx in range(scaled(1000, scale)):
+        if area_idx % 10 == 0:
+            # A small puzzle that needs an actual search
+            width, height = rng.randint(4, 6), rng.randint(4, 6)
+            shape_counts = [0] * len(D12_SHAPES)
+            for _ in range(2):
+                shape_counts[rng.randrange(len(D12_SHAPES))] += 1
+        else:
+            width, height = rng.randint(35, 50), rng.randint(35, 50)
+            per_shape = (width // 3) * (height // 3) // len(D12_SHAPES)
+            if rng.random() < 0.5:
+                # Trivially fits into the 3x3 bounding boxes
+                shape_counts = [rng.randint(0, per_shape) for _ in D12_SHAPES]
+            else:
+                # Has more shape cells than the area has
+                shape_counts = [per_shape * 2 for _ in D12_SHAPES]
+                assert sum(c * n for c, n in zip(shape_cells, shape_counts)) > width * height
+
+        lines.append(f"{width}x{height}: {' '.join(map(str, shape_counts))}")
+
+    return "\n".join(lines) + "\n"
+
+
+GENERATORS: dict[int, Generator] = {
+    1: generate_d01,
+    2: generate_d02,
+    3: generate_d03,
+    4: generate_d04,
+    5: generate_d05,
+    6: generate_d06,
+    7: generate_d07,
+    8: generate_d08,
+    9: generate_d09,
+    10: generate_d10,
+    11: generate_d11,
+    12: generate_d12,
+}
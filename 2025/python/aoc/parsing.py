@@ -0,0 +1,52 @@
+import mmap
+import re
+from array import array
+
+INT_PATTERN = re.compile(rb"-?\d+")
+
+# Maps ASCII digits to their values, e.g. b"0" -> b"\x00"
+DIGIT_TABLE = bytes.maketrans(b"0123456789", bytes(range(10)))
+
+
+def read_bytes(filename: str) -> bytes:
+    with open(filename, "rb") as f:
+        if f.seek(0, 2) == 0:
+            return b""
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm[:]
+
+
+def read_ints(data: bytes) -> array:
+    return array("q", map(int, INT_PATTERN.findall(data)))
+
+
+def find_char_positions(data: bytes, char: bytes) -> tuple[array, array]:
+    xs = array("l")
+    ys = array("l")
+
+    char_pattern = re.compile(re.escape(char))
+    for y, line in enumerate(data.split(b"\n")):
+        for match in char_pattern.finditer(line):
+            xs.append(match.start())
+            ys.append(y)
+
+    return xs, ys
+
+
+def read_digit_rows(data: bytes) -> list[bytes]:
+    # Every byte of the returned rows is a digit value, so the rows can be
+    # indexed and iterated like lists of ints. The digit values are all
+    # below «ord("\n")», so the line breaks survive the translation.
+    # Windows line endings are dropped first, as «\r» would otherwise be
+    # read as a digit.
+    data = data.replace(b"\r\n", b"\n")
+
+    return [row for row in data.translate(DIGIT_TABLE).split(b"\n") if row]
+
+
+def transpose_lines(lines: list[bytes]) -> list[bytes]:
+    width = max((len(line) for line in lines), default=0)
+    padded = [line.ljust(width) for line in lines]
+
+    return [bytes(column) for column in zip(*padded)]
@@ -0,0 +1,106 @@
+import contextlib
+import functools
+import time
+from typing import Any, Callable, ContextManager, Iterator, TypeVar
+
+T = TypeVar("T")
+
+
+class PhaseStats:
+    def __init__(self) -> None:
+        self.durations: dict[str, float] = {}
+        self.counters: dict[str, int] = {}
+
+    def add_duration(self, name: str, seconds: float) -> None:
+        self.durations[name] = self.durations.get(name, 0.0) + seconds
+
+    def add_count(self, name: str, value: int) -> None:
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def format(self) -> str:
+        parts = [f"{name} {seconds:.3f}s" for name, seconds in self.durations.items()]
+        parts += [f"{name}={value}" for name, value in self.counters.items()]
+
+        return ", ".join(parts)
+
+
+class Phase:
+    def __init__(self, stats: PhaseStats | None, name: str) -> None:
+        self.stats = stats
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if self.stats is not None:
+            self.stats.add_duration(self.name, time.perf_counter() - self.start)
+
+        if _exit_hook is not None:
+            _exit_hook(self.name)
+
+
+# Stats of the solve currently being measured, «None» when disabled
+_active_stats: PhaseStats | None = None
+
+# Called with the phase's name whenever a phase ends, while the data built
+# during it is still alive (used by the memory profiler)
+_exit_hook: Callable[[str], None] | None = None
+
+_NULL_PHASE = contextlib.nullcontext()
+
+
+def phase(name: str) -> ContextManager[None]:
+    if _active_stats is None and _exit_hook is None:
+        return _NULL_PHASE
+
+    return Phase(_active_stats, name)
+
+
+def count(name: str, value: int = 1) -> None:
+    # Meant for totals known at the end of a phase; hot loops should keep
+    # a local counter and report it once
+    if _active_stats is not None:
+        _active_stats.add_count(name, value)
+
+
+def timed_phase(name: str) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            if _active_stats is None and _exit_hook is None:
+                return func(*args, **kwargs)
+
+            with Phase(_active_stats, name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def collect_stats(func: Callable[..., T], *args: Any) -> tuple[T, PhaseStats]:
+    global _active_stats
+
+    previous_stats = _active_stats
+    stats = PhaseStats()
+    _active_stats = stats
+    try:
+        answer = func(*args)
+    finally:
+        _active_stats = previous_stats
+
+    return answer, stats
+
+
+@contextlib.contextmanager
+def phase_exit_hook(hook: Callable[[str], None]) -> Iterator[None]:
+    global _exit_hook
+
+    previous_hook = _exit_hook
+    _exit_hook = hook
+    try:
+        yield
+    finally:
+        _exit_hook = previous_hook
@@ -0,0 +1,135 @@
+import argparse
+import cProfile
+import json
+import pstats
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, TypeVar
+
+from aoc.cache import CACHE_DIR
+from aoc.phases import phase_exit_hook
+
+T = TypeVar("T")
+
+PROFILE_MODES = ["cpu", "mem"]
+
+PROFILE_DIR = CACHE_DIR / "profiles"
+
+TOP_ENTRY_COUNT = 20
+
+ProfileReport = dict[str, Any]
+
+
+def add_profile_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--profile", choices=PROFILE_MODES,
+                        help="profile the solve with cProfile (cpu) "
+                             "or tracemalloc (mem)")
+    parser.add_argument("--profile-output", type=Path, default=None,
+                        help="where to write the JSON profile report")
+
+
+def profile_cpu(func: Callable[..., T], *args: Any) -> tuple[T, ProfileReport]:
+    profiler = cProfile.Profile()
+    answer = profiler.runcall(func, *args)
+
+    stats = pstats.Stats(profiler)
+    stats.sort_stats(pstats.SortKey.TIME).print_stats(TOP_ENTRY_COUNT)
+
+    entries: list[dict[str, Any]] = []
+    for (filename, line, function), (_, call_count, total_time, cumulative_time, _) \
+            in stats.stats.items():  # type: ignore[attr-defined]
+        entries.append({
+            "file": filename,
+            "line": line,
+            "function": function,
+            "calls": call_count,
+            "total_time": total_time,
+            "cumulative_time": cumulative_time,
+        })
+    entries.sort(key=lambda entry: entry["total_time"], reverse=True)
+
+    return answer, {"entries": entries[:TOP_ENTRY_COUNT]}
+
+
+def profile_mem(func: Callable[..., T], *args: Any) -> tuple[T, ProfileReport]:
+    # The snapshot is taken at the end of whichever phase (or of the whole
+    # solve) left the most memory allocated, since by the time the solve
+    # returns most of its data is usually gone
+    snapshot: tracemalloc.Snapshot | None = None
+    snapshot_phase = ""
+    snapshot_size = -1
+
+    def snapshot_if_largest(phase_name: str) -> None:
+        nonlocal snapshot, snapshot_phase, snapshot_size
+
+        current_size, _ = tracemalloc.get_traced_memory()
+        if current_size > snapshot_size:
+            snapshot = tracemalloc.take_snapshot()
+            snapshot_phase = phase_name
+            snapshot_size = current_size
+
+    tracemalloc.start()
+    try:
+        with phase_exit_hook(snapshot_if_largest):
+            answer = func(*args)
+        _, peak_size = tracemalloc.get_traced_memory()
+        snapshot_if_largest("end of solve")
+    finally:
+        tracemalloc.stop()
+
+    assert snapshot is not None
+    top_stats = snapshot.statistics("lineno")[:TOP_ENTRY_COUNT]
+
+    print(f"Peak traced memory: {peak_size / 1024:.1f} KiB")
+    print(f"Top allocation sites alive at {snapshot_phase} "
+          f"({snapshot_size / 1024:.1f} KiB traced):")
+    for stat in top_stats:
+        print(f"  {stat}")
+
+    entries = [{
+        "file": stat.traceback[0].filename,
+        "line": stat.traceback[0].lineno,
+        "size": stat.size,
+        "count": stat.count,
+    } for stat in top_stats]
+
+    return answer, {"peak_size": peak_size, "snapshot_phase": snapshot_phase,
+                    "snapshot_size": snapshot_size, "entries": entries}
+
+
+def write_report(report: ProfileReport, report_path: Path) -> None:
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=1)
+
+
+def run_with_profile(mode: str | None, func: Callable[..., T], *args: Any,
+                     report_path: Path | None = None) -> T:
+    if mode is None:
+        return func(*args)
+
+    start = time.perf_counter()
+    if mode == "cpu":
+        answer, report = profile_cpu(func, *args)
+    else:
+        assert mode == "mem"
+        answer, report = profile_mem(func, *args)
+    wall_time = time.perf_counter() - start
+
+    source = Path(func.__code__.co_filename)
+    report.update({
+        "mode": mode,
+        "source": source.stem,
+        "function": func.__name__,
+        "args": [repr(arg) for arg in args],
+        "timestamp": time.time(),
+        "wall_time": wall_time,
+    })
+
+    if report_path is None:
+        report_path = PROFILE_DIR / f"{source.stem}-{mode}.json"
+    write_report(report, report_path)
+    print(f"Profile report written to {report_path}")
+
+    return answer
@@ -0,0 +1,163 @@
+import argparse
+import contextlib
+import importlib.util
+import io
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from types import ModuleType
+from typing import NamedTuple
+
+from aoc.phases import PhaseStats, collect_stats
+
+YEAR_DIR = Path(__file__).resolve().parent.parent
+
+# Matches solution modules like «d04p02.py»
+SOLUTION_PATTERN = re.compile(r"^d(\d{2})p(\d{2})\.py$")
+
+# Some solvers recurse close to the default limit of 1000 frames, which
+# the worker or benchmark machinery around them would otherwise push them
+# over, and larger generated inputs recurse deeper still
+SOLVER_RECURSION_LIMIT = 10_000
+
+
+class Job(NamedTuple):
+    day: int
+    part: int
+    module_path: Path
+    input_path: Path
+
+
+class JobResult(NamedTuple):
+    job: Job
+    answer: int | None
+    wall_time: float
+    cpu_time: float
+    error: str | None
+    stats: PhaseStats | None = None
+
+
+def discover_jobs(days: list[int] | None = None,
+                  input_name: str = "input") -> list[Job]:
+    jobs: list[Job] = []
+
+    for day_dir in sorted(YEAR_DIR.iterdir()):
+        if not day_dir.is_dir() or not day_dir.name.isdigit():
+            continue
+
+        for module_path in sorted(day_dir.iterdir()):
+            match = SOLUTION_PATTERN.match(module_path.name)
+            if match is None:
+                continue
+
+            day, part = int(match.group(1)), int(match.group(2))
+            if days and day not in days:
+                continue
+
+            input_path = day_dir / f"d{day:02}_{input_name}.txt"
+            if not input_path.is_file():
+                continue
+
+            jobs.append(Job(day, part, module_path, input_path))
+
+    return jobs
+
+
+def load_module(module_path: Path) -> ModuleType:
+    spec = importlib.util.spec_from_file_location(module_path.stem, module_path)
+    assert spec is not None and spec.loader is not None
+
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    return module
+
+
+def raise_recursion_limit() -> None:
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), SOLVER_RECURSION_LIMIT))
+
+
+def run_job(job: Job, with_stats: bool = False) -> JobResult:
+    stats: PhaseStats | None = None
+
+    try:
+        module = load_module(job.module_path)
+
+        # Some solvers report their progress, which would only garble
+        # the output of the other workers
+        with contextlib.redirect_stdout(io.StringIO()):
+            wall_start = time.perf_counter()
+            cpu_start = time.process_time()
+            if with_stats:
+                answer, stats = collect_stats(module.solve, str(job.input_path))
+            else:
+                answer = module.solve(str(job.input_path))
+            cpu_time = time.process_time() - cpu_start
+            wall_time = time.perf_counter() - wall_start
+    except Exception as error:
+        return JobResult(job, None, 0.0, 0.0, f"{type(error).__name__}: {error}")
+
+    return JobResult(job, answer, wall_time, cpu_time, None, stats)
+
+
+def run_jobs(jobs: list[Job], workers: int | None = None,
+             with_stats: bool = False) -> list[JobResult]:
+    results: list[JobResult] = []
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=raise_recursion_limit) as executor:
+        futures = [executor.submit(run_job, job, with_stats) for job in jobs]
+        for future in as_completed(futures):
+            results.append(future.result())
+
+    results.sort(key=lambda result: (result.job.day, result.job.part))
+
+    return results
+
+
+def print_results(results: list[JobResult], elapsed: float) -> None:
+    print(f"{'Day':>3} {'Part':>4} {'Answer':>20} {'Wall':>10} {'CPU':>10}")
+
+    for job, answer, wall_time, cpu_time, error, _ in results:
+        if error is not None:
+            print(f"{job.day:>3} {job.part:>4} {'-':>20} {'-':>10} {'-':>10}  {error}")
+        else:
+            print(f"{job.day:>3} {job.part:>4} {answer:>20} "
+                  f"{wall_time:>9.3f}s {cpu_time:>9.3f}s")
+
+    phase_results = [result for result in results
+                     if result.stats is not None
+                     and (result.stats.durations or result.stats.counters)]
+    if len(phase_results) > 0:
+        print("\nPhases:")
+        for result in phase_results:
+            assert result.stats is not None
+            print(f"{result.job.day:>3} {result.job.part:>4}  {result.stats.format()}")
+
+    total_cpu_time = sum(result.cpu_time for result in results)
+    print(f"\nTotal wall time: {elapsed:.3f}s, total CPU time: {total_cpu_time:.3f}s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="aoc")
+    parser.add_argument("days", nargs="*", type=int,
+                        help="days to solve (all by default)")
+    parser.add_argument("--input", default="input",
+                        help="input name, e.g. «input» for dNN_input.txt")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker process count (CPU count by default)")
+    parser.add_argument("--stats", action="store_true",
+                        help="report the solvers' phase timings and counters")
+    args = parser.parse_args()
+
+    jobs = discover_jobs(args.days, args.input)
+    if len(jobs) == 0:
+        print("No matching puzzles found.")
+        return
+
+    start = time.perf_counter()
+    results = run_jobs(jobs, args.workers, args.stats)
+    elapsed = time.perf_counter() - start
+
+    print_results(results, elapsed)
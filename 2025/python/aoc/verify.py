@@ -0,0 +1,38 @@
+import hashlib
+from pathlib import Path
+
+from aoc.cache import CACHE_DIR, file_digest, is_cache_enabled, source_digest
+
+VERIFIED_DIR = CACHE_DIR / "verified"
+
+
+def get_marker_path(source_filename: str, input_filename: str,
+                    expected_answer: object, parameters: object) -> Path:
+    key = "\n".join([
+        source_digest(source_filename),
+        file_digest(input_filename),
+        repr(parameters),
+        repr(expected_answer),
+    ])
+
+    return VERIFIED_DIR / hashlib.sha256(key.encode()).hexdigest()
+
+
+def is_verified(source_filename: str, input_filename: str,
+                expected_answer: object, parameters: object = None) -> bool:
+    if not is_cache_enabled() or not Path(input_filename).is_file():
+        return False
+
+    return get_marker_path(source_filename, input_filename,
+                           expected_answer, parameters).is_file()
+
+
+def record_verified(source_filename: str, input_filename: str,
+                    expected_answer: object, parameters: object = None) -> None:
+    if not is_cache_enabled():
+        return
+
+    marker_path = get_marker_path(source_filename, input_filename,
+                                  expected_answer, parameters)
+    marker_path.parent.mkdir(parents=True, exist_ok=True)
+    marker_path.touch()